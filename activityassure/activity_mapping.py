@@ -3,11 +3,27 @@ Functions for loading activity mappings and collecting the
 activities available therein.
 """
 
+import functools
 import json
 import logging
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_mapping_file(path: Path, mtime: float) -> dict[str, str]:
+    """
+    Parses a mapping file. The results are cached, as the same mapping
+    files are often loaded multiple times in a single run. The modification
+    time is part of the cache key, so changed files are parsed again.
+
+    :param path: mapping file path
+    :param mtime: modification time of the file
+    :return: the mapping dict; must not be modified
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_mapping(path: Path) -> dict[str, str]:
     """
     Loads an activity mapping from a json file.
@@ -18,8 +34,9 @@ def load_mapping(path: Path) -> dict[str, str]:
     """
     if not path.exists():
         raise RuntimeError(f"Missing mapping file: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # return a copy, so the cached mapping is not affected by changes
+    path = path.resolve()
+    return dict(_parse_mapping_file(path, path.stat().st_mtime))
 
 
 def get_activities_in_mapping(mapping: dict[str, str]) -> list[str]:
@@ -51,11 +68,13 @@ def check_activity_lists(
     types_custom = set(activities)
     types_val = set(validation_activities)
     if types_custom != types_val:
-        logging.warn(
+        logging.warning(
             "The applied activity mapping does not use the same set of activity types as the "
             "validation data.\n"
-            f"Missing activity types: {types_val - types_custom}\n"
-            f"Additional activity types: {types_custom - types_val}"
+            "Missing activity types: %s\n"
+            "Additional activity types: %s",
+            types_val - types_custom,
+            types_custom - types_val,
         )
         return validation_activities + list(types_custom - types_val)
     else:
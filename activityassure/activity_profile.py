@@ -121,11 +121,20 @@ class SparseActivityProfile:
         timestep_col = "Timestep"
         date_col = "Date"
         activity_col = "Activity"
-        data = pd.read_csv(path)
-        entries = data.apply(  # type: ignore
-            lambda row: ActivityProfileEntry(row[activity_col], row[timestep_col]),
-            axis=1,
-        ).to_list()
+        # only parse the relevant columns, and skip type inference where possible
+        data = pd.read_csv(
+            path,
+            usecols=lambda c: c in (timestep_col, date_col, activity_col),
+            dtype={timestep_col: "int64", date_col: str, activity_col: str},
+        )
+        # create the entries directly from the columns instead of building a
+        # Series object for each row
+        entries = [
+            ActivityProfileEntry(name, start)
+            for name, start in zip(
+                data[activity_col].to_list(), data[timestep_col].to_list()
+            )
+        ]
         if date_col in data.columns:
             # calculate offset based on the datetime column in the data (timedelta since last midnight)
             first_date = datetime.fromisoformat(data[date_col][0])
@@ -154,8 +163,11 @@ class SparseActivityProfile:
 
         :return: activity profile as DataFrame
         """
-        timesteps = [a.start for a in self.activities]
-        dates = [self.offset + t * self.resolution for t in timesteps]
+        timesteps = np.array([a.start for a in self.activities])
+        # calculate all dates at once on the integer timestep array
+        dates = np.timedelta64(self.offset) + timesteps * np.timedelta64(
+            self.resolution
+        )
         activities = [a.name for a in self.activities]
         df = pd.DataFrame(
             {"Timestep": timesteps, "Date": dates, "Activity": activities}
@@ -413,7 +425,7 @@ class SparseActivityProfile:
         self.resolution = resolution
         deleted_activities = original_length - len(new_activities)
         logging.info(
-            f"Resampled activity profile, deleting {deleted_activities} activities"
+            "Resampled activity profile, deleting %d activities", deleted_activities
         )
 
     @utils.timing
@@ -538,14 +550,25 @@ class ExpandedActivityProfiles:
         assert all(
             p.resolution == resolution for p in profiles
         ), "Profiles have different resolution"
-        # expand the profiles
-        rows = [p.expand() for p in profiles]
-        length = len(rows[0])
+        length = profiles[0].length()
         assert all(
-            len(row) == length for row in rows
+            p.length() == length for p in profiles
         ), "Profiles have different lengths"
+        # expand the profiles directly into a preallocated array instead
+        # of creating a separate list for each profile first; each activity
+        # name is repeated according to its duration in a single numpy call
+        values = np.empty((len(profiles), length), dtype=object)
+        for i, p in enumerate(profiles):
+            names = np.array([a.name for a in p.activities], dtype=object)
+            durations = [a.duration for a in p.activities]
+            # the activities must cover the whole profile without gaps, as
+            # in SparseActivityProfile.expand
+            assert (
+                sum(durations) == length
+            ), f"Activity durations of profile {p.filename} do not add up to its length"
+            values[i] = np.repeat(names, durations)
         column_names = [f"Timestep {i}" for i in range(1, length + 1)]
-        data = pd.DataFrame(rows, columns=column_names)
+        data = pd.DataFrame(values, columns=column_names)
         return ExpandedActivityProfiles(data, profile_type, offset, resolution)
 
     @utils.timing
@@ -559,15 +582,28 @@ class ExpandedActivityProfiles:
         :return: list of activity profiles in sparse format
         """
         profiles: list[SparseActivityProfile] = []
+        values = self.data.to_numpy()
+        num_timesteps = values.shape[1]
+        # replace missing values with a single placeholder object, so that
+        # consecutive missing values form one group instead of being unequal
+        # to each other
+        comparable = np.where(pd.isna(values), object(), values)
+        # mark all time slots where a new activity starts, for all diary
+        # entries at once
+        is_start = np.ones(values.shape, dtype=bool)
+        is_start[:, 1:] = comparable[:, 1:] != comparable[:, :-1]
         # iterate through all diary entries
-        for index, row in self.data.iterrows():
-            entries = []
-            start = 0
-            # iterate through groups of consecutive slots with the same code
-            for code, group in itertools.groupby(row):
-                length = len(list(group))
-                entries.append(ActivityProfileEntry(code, start, length))
-                start += length
+        for index, row, row_starts in zip(self.data.index, values, is_start):
+            # get start and duration of each group of consecutive slots with
+            # the same code
+            starts = np.flatnonzero(row_starts)
+            durations = np.diff(starts, append=num_timesteps)
+            entries = [
+                ActivityProfileEntry(code, start, length)
+                for code, start, length in zip(
+                    row[starts].tolist(), starts.tolist(), durations.tolist()
+                )
+            ]
             # determine the weight if there is one
             weight = self.weights[index] if self.weights is not None else None  # type: ignore[call-overload]
             # create ActivityProfile objects out of the activity entries
@@ -107,7 +107,7 @@ class ValidationIndicators:
         )
         df = self.to_dataframe()
         df.to_csv(filepath)
-        logging.debug(f"Created metrics csv file {filepath}")
+        logging.debug("Created metrics csv file %s", filepath)
 
 
 def calc_probability_curves_diff(
@@ -137,15 +137,33 @@ def calc_rmse(differences: pd.DataFrame) -> pd.Series:
 
 
 def calc_pearson_coeff(data1: pd.DataFrame, data2: pd.DataFrame) -> pd.Series:
+    # calculate the coefficients for all rows at once instead of correlating
+    # each pair of rows separately
+    values1 = data1.to_numpy(dtype=np.float64)
+    values2 = data2.loc[data1.index, data1.columns].to_numpy(dtype=np.float64)
+    # like Series.corr, only use the pairs of values where both are available
+    valid = ~(np.isnan(values1) | np.isnan(values2))
+    counts = valid.sum(axis=1, keepdims=True)
+    # rows with constant values or too few valid pairs have no defined
+    # correlation and result in NaN
     with np.errstate(divide="ignore", invalid="ignore"):
-        coeffs = [data1.loc[i].corr(data2.loc[i]) for i in data1.index]
+        mean1 = np.where(valid, values1, 0).sum(axis=1, keepdims=True) / counts
+        mean2 = np.where(valid, values2, 0).sum(axis=1, keepdims=True) / counts
+        centered1 = np.where(valid, values1 - mean1, 0)
+        centered2 = np.where(valid, values2 - mean2, 0)
+        covariance = (centered1 * centered2).sum(axis=1)
+        norm = np.sqrt((centered1**2).sum(axis=1) * (centered2**2).sum(axis=1))
+        coeffs = covariance / norm
     return pd.Series(coeffs, index=data1.index)
 
 
 def calc_wasserstein(data1: pd.DataFrame, data2: pd.DataFrame) -> pd.Series:
+    # convert to arrays once instead of looking up each row separately
+    values1 = data1.to_numpy()
+    values2 = data2.loc[data1.index].to_numpy()
     distances = [
-        scipy.stats.wasserstein_distance(data1.loc[i], data2.loc[i])
-        for i in data1.index
+        scipy.stats.wasserstein_distance(row1, row2)
+        for row1, row2 in zip(values1, values2)
     ]
     return pd.Series(distances, index=data1.index)
 
@@ -182,15 +200,17 @@ def normalize(data: pd.DataFrame) -> pd.DataFrame:
     minimum = data.min(axis=1)
     maximum = data.max(axis=1)
     val_range = maximum - minimum
-    without_offset = data.subtract(minimum, axis=0)
-    normalized = without_offset.divide(val_range, axis=0)
-    # rows where the value range was 0 now contain NaN -  take
-    # the values without offset
-    normalized = normalized.combine_first(without_offset)
-    for label, row in normalized.iterrows():
-        assert (np.isclose(row.min(), 0) and np.isclose(row.max(), 1)) or all(
-            row == row.iloc[0]
-        ), "Bug in normalization"
+    # rows with a value range of 0 only contain zeros after subtracting the
+    # offset; dividing them by 1 keeps them as they are and avoids creating
+    # NaN values that would have to be replaced afterwards
+    val_range = val_range.mask(val_range == 0, 1)
+    normalized = data.subtract(minimum, axis=0).divide(val_range, axis=0)
+    # check all rows at once: each row must either span [0, 1] or be constant
+    spans_range = np.isclose(normalized.min(axis=1), 0) & np.isclose(
+        normalized.max(axis=1), 1
+    )
+    constant = normalized.eq(normalized.iloc[:, 0], axis=0).all(axis=1)
+    assert (spans_range | constant).all(), "Bug in normalization"
     return normalized
 
 
@@ -253,6 +273,25 @@ def calc_comparison_indicators(
     prob_profiles_val, prob_profiles_in = check_data_compatibility(
         prob_profiles_val, prob_profiles_in
     )
+    differences, metrics = calc_indicators_for_aligned_data(
+        prob_profiles_val, prob_profiles_in
+    )
+    if add_kpi_means:
+        metrics.add_metric_means()
+    return differences, metrics
+
+
+def calc_indicators_for_aligned_data(
+    prob_profiles_val: pd.DataFrame, prob_profiles_in: pd.DataFrame
+) -> tuple[pd.DataFrame, ValidationIndicators]:
+    """
+    Calculates comparison indicators for two sets of probability profiles
+    that were already aligned using check_data_compatibility.
+
+    :param prob_profiles_val: aligned validation probability profiles
+    :param prob_profiles_in: aligned input probability profiles
+    :return: the probability curve difference profiles, and the indicators
+    """
     differences = calc_probability_curves_diff(prob_profiles_val, prob_profiles_in)
 
     # calc KPIs per activity
@@ -263,8 +302,6 @@ def calc_comparison_indicators(
     wasserstein = calc_wasserstein(prob_profiles_val, prob_profiles_in)
 
     metrics = ValidationIndicators(mae, bias, rmse, wasserstein, pearson_corr)
-    if add_kpi_means:
-        metrics.add_metric_means()
     return differences, metrics
 
 
@@ -293,9 +330,14 @@ def calc_all_indicator_variants(
     :return: a tuple containing the difference profiles for the activity probabilities
              and the three indicator variants
     """
+    # align the probability profiles only once for all variants; normalizing
+    # afterwards gives the same result, as it works on each row individually
+    prob_profiles_val, prob_profiles_in = check_data_compatibility(
+        validation_data.probability_profiles, input_data.probability_profiles
+    )
     # calcluate and store comparison metrics as normal, scaled and normalized
-    differences, indicators = calc_comparison_indicators(
-        validation_data, input_data, add_kpi_means=False
+    differences, indicators = calc_indicators_for_aligned_data(
+        prob_profiles_val, prob_profiles_in
     )
     # calc metrics as normal, scaled and normalized variants
     shares = validation_data.probability_profiles.mean(axis=1)
@@ -304,9 +346,11 @@ def calc_all_indicator_variants(
         # add metric means only after obtaining the scaled metrics
         indicators.add_metric_means()
         scaled.add_metric_means()
-    _, normalized = calc_comparison_indicators(
-        validation_data, input_data, True, add_kpi_means=add_means
+    _, normalized = calc_indicators_for_aligned_data(
+        normalize(prob_profiles_val), normalize(prob_profiles_in)
     )
+    if add_means:
+        normalized.add_metric_means()
     if save_to_file:
         assert profile_type is not None, "Must specify a profile type for saving"
         assert output_path is not None, "Must specify an output path for saving"
@@ -124,7 +124,7 @@ def check_countries(data):
     if len(countries) != 17:
         all = load_data.get_hetus_file_names().keys()
         missing = [c for c in all if c not in countries]
-        logging.warning(f"Missing countries: {missing}")
+        logging.warning("Missing countries: %s", missing)
     else:
         logging.info("All countries covered")
 
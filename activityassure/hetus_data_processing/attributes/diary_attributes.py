@@ -5,6 +5,7 @@ then be used for categorization.
 
 from datetime import timedelta
 import logging
+import numpy as np
 import pandas as pd
 
 import activityassure.hetus_data_processing.hetus_column_names as col
@@ -67,16 +68,21 @@ def determine_day_types(data: pd.DataFrame) -> pd.Series:
     work_time_slot_numbers = activities[activities.isin(WORK_ACTIVITIES)].count(axis=1)
     # determine day type based on number of work activity entries
     work = work_time_slot_numbers > min_time_slots
-    day_types = pd.Series(index=work_time_slot_numbers.index, dtype=str)
-    day_types.loc[work] = DayType.work
-    day_types.loc[~work] = DayType.no_work
+    # assign both day types in a single pass instead of two masked assignments
+    day_types = pd.Series(
+        np.where(work, DayType.work, DayType.no_work),
+        index=work_time_slot_numbers.index,
+        dtype=str,
+    )
 
     day_types.name = DayType.title()
     counts = day_types.value_counts()
     determined = counts[counts.index != DayType.undetermined].sum()
     logging.info(
-        f"Determined day type for {determined} out of "
-        f"{len(data)} diary entries ({100 * determined / len(data):.1f} %)"
+        "Determined day type for %d out of %d diary entries (%.1f %%)",
+        determined,
+        len(data),
+        100 * determined / len(data),
     )
     # print_day_type_weekday_overview(data, day_types)
     return day_types
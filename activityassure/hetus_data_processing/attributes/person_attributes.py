@@ -98,8 +98,10 @@ def determine_work_statuses(persondata: pd.DataFrame) -> pd.Series:
         counts.index.to_series().apply(lambda x: x.is_determined())
     ].sum()
     logging.info(
-        f"Determined working status for {determined} out of "
-        f"{len(persondata)} persons ({100 * determined / len(persondata):.1f} %)"
+        "Determined working status for %d out of %d persons (%.1f %%)",
+        determined,
+        len(persondata),
+        100 * determined / len(persondata),
     )
     return results
 
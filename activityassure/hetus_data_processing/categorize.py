@@ -90,7 +90,7 @@ def categorize(
     weights_ok = col.Diary.DAY_AND_PERSON_WEIGHT in data.columns or not include_weights
     assert weights_ok, f"Weight column '{col.Diary.DAY_AND_PERSON_WEIGHT}' is missing"
     categories = data.groupby(cat_attributes)
-    logging.info(f"Sorted {len(data)} entries into {categories.ngroups} categories.")
+    logging.info("Sorted %d entries into %d categories.", len(data), categories.ngroups)
     groups = {
         ProfileCategory.from_index_tuple(
             cat_attributes,
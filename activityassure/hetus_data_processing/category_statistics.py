@@ -4,7 +4,6 @@ These can then be used for validation.
 """
 
 from collections import Counter
-from datetime import timedelta
 import logging
 from typing import Iterable
 import numpy as np
@@ -120,26 +119,36 @@ def calc_activity_group_durations(
         p.resolution == resolution for p in activity_profiles
     ), "Not all profiles have the same resolution"
     # collect the durations of all activities, and the corresponding profile weights
-    durations_by_activity: dict[str, list[timedelta]] = {}
-    weight_per_duration: dict[str, list[float | None]] = {}
+    names: list[str] = []
+    durations: list[int] = []
+    weights: list[float | None] = []
     for activity_profile in activity_profiles:
         # use the merged activity list to take the day split into account and get
         # more realistic durations for sleep etc.
-        activities = activity_profile.get_merged_activity_list()
-        for a in activities:
-            # collect durations by activity type, and convert from number of time slots
-            # to timedelta
-            durations_by_activity.setdefault(a.name, []).append(a.duration * resolution)
-            weight_per_duration.setdefault(a.name, []).append(activity_profile.weight)
-    # turn into a DataFrame (list comprehension is necessary due to different list lengths)
-    durations_series = [pd.Series(d, name=k) for k, d in durations_by_activity.items()]
-    weights_series = [pd.Series(d, name=k) for k, d in weight_per_duration.items()]
-    # create a dataframe containing all durations, and one in the same shape containing the
-    # corresponding weight for each element in the durations dataframe
-    durations = pd.concat(durations_series, axis=1)
-    weights = pd.concat(weights_series, axis=1)
-    counts = calc_weighed_value_distributions(durations, weights)
-    return counts
+        for a in activity_profile.get_merged_activity_list():
+            names.append(a.name)
+            durations.append(a.duration)
+            weights.append(activity_profile.weight)
+    # create a single table of all activities instead of one column per activity
+    # type, and convert from number of time slots to timedelta in one go
+    data = pd.DataFrame({"activity": names, "duration": durations, "weight": weights})
+    data["duration"] = data["duration"] * resolution
+    grouped = data.groupby(["duration", "activity"], sort=False)
+    if data["weight"].isna().all():
+        # no weights - simply count occurrences of durations per activity
+        counts = grouped.size()
+    else:
+        # get sum of weights per duration, per activity
+        counts = grouped["weight"].sum()
+    # convert to probabilities, keeping the activity types in order of appearance
+    counts = counts.unstack("activity").reindex(columns=data["activity"].unique())
+    probabilities = counts / counts.sum()
+    probabilities.index.name = None
+    probabilities.columns.name = None
+    # remove NA and sort by values
+    probabilities.fillna(0, inplace=True)
+    probabilities.sort_index(inplace=True)
+    return probabilities
 
 
 @utils.timing
@@ -196,6 +205,6 @@ def calc_statistics_per_category(
             total_weight,
         )
         statistics[profile_set.profile_type] = vs
-    logging.info(f"Created result files for {len(profile_sets)} categories")
+    logging.info("Created result files for %d categories", len(profile_sets))
     statistics_set = ValidationSet(statistics, activity_types)
     return statistics_set
@@ -4,6 +4,7 @@ This module provides functions for translating HETUS columns and codes to readab
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from activityassure import activity_mapping
@@ -77,5 +78,11 @@ def translate_activity_codes(data: pd.DataFrame) -> list[str]:
     # the defined activity type mapping
     combined = get_combined_hetus_mapping()
     activity = col.get_activity_data(data)
-    data.loc[:, activity.columns] = activity.replace(combined)
+    # translate each distinct code only once using a lookup table instead of
+    # replacing each code separately in the whole dataframe; codes that are
+    # not in the mapping remain unchanged
+    values = activity.to_numpy()
+    codes, uniques = pd.factorize(values.ravel(), use_na_sentinel=False)
+    lookup = np.array([combined.get(u, u) for u in uniques], dtype=object)
+    data.loc[:, activity.columns] = lookup[codes].reshape(values.shape)
     return activity_mapping.get_activities_in_mapping(combined)
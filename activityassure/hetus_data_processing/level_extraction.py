@@ -65,8 +65,11 @@ def group_rows_by_level(
         # assume all values in the group are equal and simply select the first one
         grouped_data = grouped.first()
     logging.info(
-        f"Extracted {len(grouped_data)} groups on {level.NAME} level "
-        f"from {len(data)} entries in {time.time() - start:.1f} s"
+        "Extracted %d groups on %s level from %d entries in %.1f s",
+        len(grouped_data),
+        level.NAME,
+        len(data),
+        time.time() - start,
     )
     return grouped_data
 
@@ -93,8 +96,10 @@ def get_consistent_groups(data: pd.DataFrame, level: Type[col.HetusLevel]) -> pd
         inconsistent_columns_per_group == 0
     ].index
     logging.info(
-        f"Out of {len(num_values_per_group)} groups on {level.NAME} level, "
-        f"{len(num_values_per_group) - len(consistent_groups)} are inconsistent."
+        "Out of %d groups on %s level, %d are inconsistent.",
+        len(num_values_per_group),
+        level.NAME,
+        len(num_values_per_group) - len(consistent_groups),
     )
     return consistent_groups
 
@@ -154,7 +159,9 @@ def get_complete_households(data: pd.DataFrame) -> pd.Index:
     # get households where the size matches the number of participants
     complete = merged[merged[col.Person.ID] == merged[col.HH.SIZE]].index
     logging.info(
-        f"Out of {len(merged)} households, {len(merged) - len(complete)} are incomplete."
+        "Out of %d households, %d are incomplete.",
+        len(merged),
+        len(merged) - len(complete),
     )
     return complete
 
@@ -3,12 +3,13 @@ Functions for loading HETUS data files.
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import functools
 import getpass
-from io import StringIO
+from io import BytesIO
 import os
 import time
-from typing import Iterable
+from typing import Callable, Iterable
 import pandas as pd
 import logging
 
@@ -110,45 +111,58 @@ def read_key_as_arg() -> str:
     return args.key
 
 
-def decrypt_file(path: str, key: str) -> str:
+def decrypt_file(path: str, key: str) -> bytes:
     """
     Reads and decrypts an encrypted HETUS data file.
     The key is requested in the terminal.
 
     :param path: path of the encrypted file
     :param key: the decryption key, as str
-    :return: decrypted file content
+    :return: decrypted file content, as bytes
     """
     assert os.path.isfile(path), f"File not found: {path}"
-    logging.debug(f"Decrypting file '{path}'")
+    logging.debug("Decrypting file '%s'", path)
     with open(path, "rb") as f:
         content = f.read()
     fernet = Fernet(key.encode())
-    decrypted = fernet.decrypt(content).decode()
+    # keep the raw bytes instead of decoding them to a str first; pandas
+    # can parse them directly, which avoids another copy of the whole file
+    decrypted = fernet.decrypt(content)
     return decrypted
 
 
-def load_hetus_file_from_path(path: str, key: str | None = None) -> pd.DataFrame:
+def load_hetus_file_from_path(
+    path: str,
+    key: str | None = None,
+    columns: Callable[[str], bool] | None = None,
+) -> pd.DataFrame:
     """
     Loads a single HETUS file
 
     :param path: the path of the file
     :param key: the key if the data file is encrypted, else None
+    :param columns: optional filter function for column names; only columns
+                    for which it returns True are parsed, defaults to None
+                    (all columns)
     :return: HETUS data from the file
     """
     assert os.path.isfile(path), f"File not found: {path}"
-    logging.debug(f"Loading HETUS file for {get_country(path)}")
+    logging.debug("Loading HETUS file for %s", get_country(path))
     start = time.time()
     if key:
         decrypted = decrypt_file(path, key)
-        source: StringIO | str = StringIO(decrypted)
+        source: BytesIO | str = BytesIO(decrypted)
     else:
         source = path
 
     DTYPE_DICT = build_dtype_dict()
-    data = pd.read_csv(source, dtype=DTYPE_DICT)
+    data = pd.read_csv(source, dtype=DTYPE_DICT, usecols=columns)
     logging.info(
-        f"Loaded HETUS file for {get_country(path)} with {len(data)} entries and {len(data.columns)} columns in {time.time() - start:.1f} s"
+        "Loaded HETUS file for %s with %d entries and %d columns in %.1f s",
+        get_country(path),
+        len(data),
+        len(data.columns),
+        time.time() - start,
     )
     if len(data) == 0:
         raise utils.ActValidatorException(
@@ -171,13 +185,44 @@ def load_hetus_file(country: str, path: str, key: str | None = None) -> pd.DataF
     :return: HETUS data for the country
     """
     filenames = get_hetus_file_names(path)
-    if country.upper() not in filenames.keys():
+    country = country.upper()
+    if country not in filenames.keys():
         raise RuntimeError(f"No HETUS file for country '{country}' found")
     return load_hetus_file_from_path(filenames[country], key)
 
 
+def load_hetus_files_from_paths(
+    paths: Iterable[str],
+    key: str | None = None,
+    processes: int | None = 1,
+    columns: Callable[[str], bool] | None = None,
+) -> pd.DataFrame:
+    """
+    Loads multiple HETUS files and combines them. The files are independent
+    of each other, so they can optionally be loaded in parallel.
+
+    :param paths: the paths of the files
+    :param key: the key if the data files are encrypted, else None
+    :param processes: number of worker processes to use; None uses one
+                      process per CPU, defaults to 1 (no worker processes)
+    :param columns: optional filter function for column names, see
+                    load_hetus_file_from_path; must be a module-level
+                    function when using worker processes
+    :return: HETUS data from all files
+    """
+    load = functools.partial(load_hetus_file_from_path, key=key, columns=columns)
+    if processes == 1:
+        return pd.concat(map(load, paths))
+    with ProcessPoolExecutor(processes) as executor:
+        return pd.concat(executor.map(load, paths))
+
+
 def load_hetus_files(
-    countries: Iterable[str], path: str, key: str | None = None
+    countries: Iterable[str],
+    path: str,
+    key: str | None = None,
+    processes: int | None = 1,
+    columns: Callable[[str], bool] | None = None,
 ) -> pd.DataFrame:
     """
     Loads HETUS data of multiple countries.
@@ -185,32 +230,58 @@ def load_hetus_files(
     :param countries: a list of country codes (e.g., "DE" for germany)
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param processes: number of worker processes for loading the files,
+                      defaults to 1 (no worker processes)
+    :param columns: optional filter function for column names, defaults
+                    to None (all columns)
+    :raises RuntimeError: invalid country code
     :return: HETUS data for the countries
     """
-    data = pd.concat(load_hetus_file(country, path, key) for country in countries)
+    filenames = get_hetus_file_names(path)
+    paths = []
+    for country in countries:
+        country = country.upper()
+        if country not in filenames.keys():
+            raise RuntimeError(f"No HETUS file for country '{country}' found")
+        paths.append(filenames[country])
+    data = load_hetus_files_from_paths(paths, key, processes, columns)
     return data
 
 
-def load_all_hetus_files(path: str, key: str | None = None) -> pd.DataFrame:
+def load_all_hetus_files(
+    path: str,
+    key: str | None = None,
+    processes: int | None = 1,
+    columns: Callable[[str], bool] | None = None,
+) -> pd.DataFrame:
     """
     Loads all available HETUS files.
 
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param processes: number of worker processes for loading the files,
+                      defaults to 1 (no worker processes)
+    :param columns: optional filter function for column names, defaults
+                    to None (all columns)
     :return: HETUS data for all available countries
     """
     start = time.time()
     filenames = get_hetus_file_names(path)
-    data = pd.concat(
-        load_hetus_file_from_path(filename, key) for filename in filenames.values()
-    )
+    data = load_hetus_files_from_paths(filenames.values(), key, processes, columns)
     logging.info(
-        f"Loaded all HETUS files with {len(data)} entries in {time.time() - start:.1f} s"
+        "Loaded all HETUS files with %d entries in %.1f s",
+        len(data),
+        time.time() - start,
     )
     return data
 
 
-def load_all_hetus_files_except_AT(path: str, key: str | None = None) -> pd.DataFrame:
+def load_all_hetus_files_except_AT(
+    path: str,
+    key: str | None = None,
+    processes: int | None = 1,
+    columns: Callable[[str], bool] | None = None,
+) -> pd.DataFrame:
     """
     Loads all available HETUS files, except for the Austrian file.
     Austria uses 15 minute time slots instead of the usual 10 minute time slots,
@@ -218,15 +289,19 @@ def load_all_hetus_files_except_AT(path: str, key: str | None = None) -> pd.Data
 
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param processes: number of worker processes for loading the files,
+                      defaults to 1 (no worker processes)
+    :param columns: optional filter function for column names, defaults
+                    to None (all columns)
     :return: HETUS data for all available countries except for Austria
     """
     start = time.time()
     filenames = get_hetus_file_names(path)
     del filenames["AT"]
-    data = pd.concat(
-        load_hetus_file_from_path(filename, key) for filename in filenames.values()
-    )
+    data = load_hetus_files_from_paths(filenames.values(), key, processes, columns)
     logging.info(
-        f"Loaded all HETUS files except for AT with {len(data)} entries in {time.time() - start:.1f} s"
+        "Loaded all HETUS files except for AT with %d entries in %.1f s",
+        len(data),
+        time.time() - start,
     )
     return data
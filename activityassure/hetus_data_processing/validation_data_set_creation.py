@@ -30,6 +30,33 @@ from activityassure.hetus_data_processing.categorize import (
 from activityassure.hetus_data_processing import category_statistics
 from activityassure import validation_statistics
 
+#: HETUS columns besides the activity columns that are required for
+#  creating a validation data set
+RELEVANT_COLUMNS = col.Diary.KEY + [
+    col.Person.WORK_STATUS,
+    col.Person.SELF_DECL_LABOUR_STATUS,
+    col.Person.FULL_OR_PART_TIME,
+    col.Person.SEX,
+    col.Diary.DAYTYPE,
+    col.Diary.EMPLOYED_STUDENT,
+    col.Diary.DAY_AND_PERSON_WEIGHT,
+]
+
+
+def is_relevant_column(name: str) -> bool:
+    """
+    Checks whether a HETUS column is required for creating a validation
+    data set. Can be passed to the HETUS loading functions to skip parsing
+    all other columns.
+
+    :param name: the column name as in the HETUS file
+    :return: True if the column is required, else False
+    """
+    name = name.upper()
+    return name in RELEVANT_COLUMNS or name.startswith(
+        col.Diary.MAIN_ACTIVITIES_PATTERN
+    )
+
 
 @utils.timing
 def prepare_hetus_data(
@@ -46,19 +73,9 @@ def prepare_hetus_data(
              possible activities
     """
     # extract only the columns that are actually needed to improve performance
-    relevant_columns = (
-        col.Diary.KEY
-        + [
-            col.Person.WORK_STATUS,
-            col.Person.SELF_DECL_LABOUR_STATUS,
-            col.Person.FULL_OR_PART_TIME,
-            col.Person.SEX,
-            col.Diary.DAYTYPE,
-            col.Diary.EMPLOYED_STUDENT,
-            col.Diary.DAY_AND_PERSON_WEIGHT,
-        ]
-        + [c for c in data.columns if c.startswith(col.Diary.MAIN_ACTIVITIES_PATTERN)]
-    )
+    relevant_columns = RELEVANT_COLUMNS + [
+        c for c in data.columns if c.startswith(col.Diary.MAIN_ACTIVITIES_PATTERN)
+    ]
     data = data[relevant_columns]
     data.set_index(col.Diary.KEY, inplace=True)
     activities = hetus_translations.translate_activity_codes(data)
@@ -158,6 +175,7 @@ def process_all_hetus_countries_AT_separately(
     hetus_key: str | None = None,
     cat_attributes=None,
     title: str = "",
+    processes: int | None = 1,
 ):
     """
     Generates a full HETUS validation data set for all countries. Processes
@@ -169,6 +187,8 @@ def process_all_hetus_countries_AT_separately(
     :param cat_attributes: categorization attributes to use, defaults to a
                            full categorization
     :param title: title of the validation data set
+    :param processes: number of worker processes for loading the HETUS files;
+                      None uses one process per CPU, defaults to 1
     """
     if not cat_attributes:
         cat_attributes = (
@@ -176,12 +196,17 @@ def process_all_hetus_countries_AT_separately(
         )
     # process AT data separately (different resolution)
     logging.info("--- Processing HETUS data for AT ---")
-    data_at = load_data.load_hetus_files(["AT"], hetus_path, hetus_key)
+    # only parse the columns that are actually needed
+    data_at = load_data.load_hetus_files(
+        ["AT"], hetus_path, hetus_key, columns=is_relevant_column
+    )
     result_at = process_hetus_2010_data(data_at, cat_attributes, None)
 
     # process remaining countries
     logging.info("--- Processing HETUS data for all countries except AT ---")
-    data = load_data.load_all_hetus_files_except_AT(hetus_path, hetus_key)
+    data = load_data.load_all_hetus_files_except_AT(
+        hetus_path, hetus_key, processes, is_relevant_column
+    )
     result_eu = process_hetus_2010_data(data, cat_attributes, None)
 
     assert (
@@ -197,7 +222,7 @@ def process_all_hetus_countries_AT_separately(
         title = "_".join(s.lower() for s in cat_attributes)
     # rename result directory
     combined.save(result_path / title)
-    logging.info(f"Finished creating the validation data set '{title}'")
+    logging.info("Finished creating the validation data set '%s'", title)
 
 
 if __name__ == "__main__":
@@ -213,4 +238,6 @@ if __name__ == "__main__":
     RESULT_PATH = Path("data/validation_data_sets")
 
     title = "activity_validation_data_set"
-    process_all_hetus_countries_AT_separately(HETUS_PATH, RESULT_PATH, key, None, title)
+    process_all_hetus_countries_AT_separately(
+        HETUS_PATH, RESULT_PATH, key, None, title, processes=None
+    )
@@ -4,10 +4,12 @@ person characteristics.
 """
 
 import logging
+import os
 from activityassure import utils
 from activityassure.activity_profile import SparseActivityProfile
 from datetime import timedelta
 from pathlib import Path
+from typing import Iterator
 from activityassure.profile_category import ProfileCategory
 
 import json
@@ -63,28 +65,55 @@ def get_person_traits(
     return category
 
 
-@utils.timing
-def load_activity_profiles_from_csv(
+def iter_activity_profiles_from_csv(
     path: Path,
     person_trait_file: str,
     resolution: timedelta,
     categories_per_person: bool = False,
-) -> list[SparseActivityProfile]:
-    """Loads the activity profiles in csv format from the specified folder"""
+) -> Iterator[SparseActivityProfile]:
+    """
+    Loads the activity profiles in csv format from the specified folder
+    one by one, so that not all profiles have to be kept in memory at
+    the same time.
+
+    :param path: directory containing the activity profile files
+    :param person_trait_file: path of the person characteristics file
+    :param resolution: time resolution of the activity profiles
+    :param categories_per_person: if True, the person names will be part of
+                                  the profile categories; defaults to False
+    :yield: the loaded activity profiles
+    """
     assert Path(path).is_dir(), f"Directory does not exist: {path}"
     person_traits = load_person_characteristics(person_trait_file)
-    activity_profiles = []
-    for filepath in path.iterdir():
-        if filepath.is_file():
-            person = get_person_from_filename(
-                filepath,
-            )
+    count = 0
+    # scandir provides the file type of each entry without an additional
+    # stat call per file
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            filepath = Path(entry.path)
+            person = get_person_from_filename(filepath)
             profile_type = get_person_traits(
                 person_traits, person, categories_per_person
             )
-            activity_profile = SparseActivityProfile.load_from_csv(
+            yield SparseActivityProfile.load_from_csv(
                 filepath, profile_type, resolution
             )
-            activity_profiles.append(activity_profile)
-    logging.info(f"Loaded {len(activity_profiles)} activity profiles")
-    return activity_profiles
+            count += 1
+    logging.info("Loaded %d activity profiles", count)
+
+
+@utils.timing
+def load_activity_profiles_from_csv(
+    path: Path,
+    person_trait_file: str,
+    resolution: timedelta,
+    categories_per_person: bool = False,
+) -> list[SparseActivityProfile]:
+    """Loads the activity profiles in csv format from the specified folder"""
+    return list(
+        iter_activity_profiles_from_csv(
+            path, person_trait_file, resolution, categories_per_person
+        )
+    )
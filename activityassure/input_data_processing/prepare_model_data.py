@@ -3,9 +3,12 @@ Functions for preprocessing and grouping activity profiles
 according to their category.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 import dataclasses
+import functools
 import logging
-from activityassure import categorization_attributes, utils
+import os
+from activityassure import categorization_attributes
 from activityassure.activity_profile import (
     ActivityProfileEntry,
     SparseActivityProfile,
@@ -73,7 +76,7 @@ def extract_day_profiles(
     day_profiles = activity_profile.split_into_day_profiles(day_offset)
     # this also removes profiles with missing activity durations
     day_profiles = filter_complete_day_profiles(day_profiles)
-    logging.info(f"Extracted {len(day_profiles)} single-day activity profiles")
+    logging.info("Extracted %d single-day activity profiles", len(day_profiles))
     return day_profiles
 
 
@@ -118,34 +121,90 @@ def group_profiles_by_type(
         determine_day_type(profile)
         profiles_by_type.setdefault(profile.profile_type, []).append(profile)
     logging.info(
-        f"Grouped {len(activity_profiles)} profiles into {len(profiles_by_type)} categories"
+        "Grouped %d profiles into %d categories",
+        len(activity_profiles),
+        len(profiles_by_type),
     )
     return profiles_by_type
 
 
+def prepare_profile(
+    full_year_profile: SparseActivityProfile, activity_mapping: dict[str, str]
+) -> dict[ProfileCategory, list[SparseActivityProfile]] | None:
+    """
+    Maps, splits and categorizes a single full-year profile.
+
+    :param full_year_profile: the profile to prepare
+    :param activity_mapping: the activity mapping to apply
+    :return: the resulting single-day profiles per category, or None
+             if the profile was skipped because it was empty or too short
+    """
+    logging.debug("Preparing profile from file %s", full_year_profile.filename)
+    # skip empty profiles
+    if not full_year_profile.activities or len(full_year_profile.activities) < 5:
+        logging.warning("Skipping empty/short profile %s", full_year_profile.filename)
+        return None
+    # resample profiles to validation data resolution
+    full_year_profile.resample(hetus_constants.RESOLUTION)
+    # translate activities to the common set of activity types
+    full_year_profile.apply_activity_mapping(activity_mapping)
+    # split the full year profiles into single-day profiles
+    selected_day_profiles = extract_day_profiles(full_year_profile)
+
+    # categorize single-day profiles according to country, person and day type
+    return group_profiles_by_type(selected_day_profiles)
+
+
 def prepare_input_data(
-    full_year_profiles: list[SparseActivityProfile], activity_mapping: dict[str, str]
+    full_year_profiles: Iterable[SparseActivityProfile],
+    activity_mapping: dict[str, str],
+    processes: int | None = 1,
 ) -> dict[ProfileCategory, list[SparseActivityProfile]]:
-    # map and categorize each full-year profile individually
+    """
+    Maps and categorizes all full-year profiles. The profiles are
+    independent of each other, so they can optionally be prepared
+    in parallel.
+
+    :param full_year_profiles: the profiles to prepare; can be an iterator to
+                               load the profiles one at a time
+    :param activity_mapping: the activity mapping to apply
+    :param processes: number of worker processes to use; 1 prepares all
+                      profiles in the main process, None uses all CPUs;
+                      defaults to 1
+    :return: the single-day profiles per category
+    """
+    prepare = functools.partial(prepare_profile, activity_mapping=activity_mapping)
+    if processes == 1:
+        return merge_prepared_profiles(map(prepare, full_year_profiles))
+    # the process pool submits all tasks at once anyway
+    full_year_profiles = list(full_year_profiles)
+    workers = processes or os.cpu_count() or 1
+    # send the profiles in chunks to reduce the inter-process communication overhead
+    chunksize = max(1, len(full_year_profiles) // (4 * workers))
+    with ProcessPoolExecutor(workers) as pool:
+        results = pool.map(prepare, full_year_profiles, chunksize=chunksize)
+        return merge_prepared_profiles(results)
+
+
+def merge_prepared_profiles(
+    results: Iterable[dict[ProfileCategory, list[SparseActivityProfile]] | None],
+) -> dict[ProfileCategory, list[SparseActivityProfile]]:
+    """
+    Combines the categorized profiles of all full-year profiles.
+
+    :param results: the results of prepare_profile for each full-year profile
+    :return: the single-day profiles per category
+    """
     all_profiles_by_type: dict[ProfileCategory, list[SparseActivityProfile]] = {}
     empty_profiles = 0
-    for full_year_profile in full_year_profiles:
-        logging.debug(f"Preparing profile from file {full_year_profile.filename}")
-        # skip empty profiles
-        if not full_year_profile.activities or len(full_year_profile.activities) < 5:
-            logging.warn(f"Skipping empty/short profile {full_year_profile.filename}")
+    for profiles_by_type in results:
+        if profiles_by_type is None:
+            empty_profiles += 1
             continue
-        # resample profiles to validation data resolution
-        full_year_profile.resample(hetus_constants.RESOLUTION)
-        # translate activities to the common set of activity types
-        full_year_profile.apply_activity_mapping(activity_mapping)
-        # split the full year profiles into single-day profiles
-        selected_day_profiles = extract_day_profiles(full_year_profile)
-
-        # categorize single-day profiles according to country, person and day type
-        profiles_by_type = group_profiles_by_type(selected_day_profiles)
-
-        all_profiles_by_type = utils.merge_dicts(all_profiles_by_type, profiles_by_type)
+        # extend the lists in place instead of rebuilding the merged dict
+        # for every single profile
+        for profile_type, profiles in profiles_by_type.items():
+            all_profiles_by_type.setdefault(profile_type, []).extend(profiles)
     if empty_profiles > 0:
-        logging.warn(f"Skipped {empty_profiles} empty/short profiles.")
+        logging.warning("Skipped %d empty/short profiles.", empty_profiles)
     return all_profiles_by_type
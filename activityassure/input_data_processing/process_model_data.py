@@ -3,7 +3,9 @@ Functions for the whole input data processing, starting from loading
 data files and resulting in a complete validation statistics set.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
+import functools
 from pathlib import Path
 from activityassure import activity_mapping, utils
 from activityassure.activity_profile import (
@@ -44,20 +46,28 @@ def calc_input_data_statistics(
 def calc_statistics_per_category(
     input_data_dict: dict[ProfileCategory, list[SparseActivityProfile]],
     activities: list[str],
+    processes: int | None = 1,
 ) -> ValidationSet:
     """
     Calculates statistics per category
 
     :param input_data_dict: input activity profiles per category
     :param activities: list of possible activities
+    :param processes: number of worker processes to use; 1 calculates all
+                      statistics in the main process, None uses all CPUs;
+                      defaults to 1
     :return: data statistics per category
     """
-    # validate each profile type individually
-    input_statistics = {}
-    for profile_type, profiles in input_data_dict.items():
-        # calculate and store statistics for validation
-        input_data = calc_input_data_statistics(profiles, activities)
-        input_statistics[profile_type] = input_data
+    # the statistics of each profile type are independent of each other
+    calc_statistics = functools.partial(
+        calc_input_data_statistics, activity_types=activities
+    )
+    if processes == 1:
+        results = list(map(calc_statistics, input_data_dict.values()))
+    else:
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(calc_statistics, input_data_dict.values()))
+    input_statistics = dict(zip(input_data_dict.keys(), results))
     statistics_set = ValidationSet(input_statistics, activities)
     return statistics_set
 
@@ -70,6 +80,7 @@ def process_model_data(
     resolution: timedelta,
     validation_activities: list[str] = [],
     categories_per_person: bool = False,
+    processes: int | None = 1,
 ) -> ValidationSet:
     """
     Processes the input data to produce the validation statistics.
@@ -84,9 +95,12 @@ def process_model_data(
     :param categories_per_person: if True, the person names will be part of the
                                   person categorization, meaning that each person
                                   will get their own categories; defaults to False
+    :param processes: number of worker processes for preparing the profiles
+                      and calculating the statistics; None uses all CPUs;
+                      defaults to 1
     """
-    # load and preprocess all input data
-    full_year_profiles = load_model_data.load_activity_profiles_from_csv(
+    # load and preprocess the input data profile by profile
+    full_year_profiles = load_model_data.iter_activity_profiles_from_csv(
         input_path, person_trait_file, resolution, categories_per_person
     )
     mapping, activities = activity_mapping.load_mapping_and_activities(mapping_path)
@@ -95,7 +109,11 @@ def process_model_data(
         activities = activity_mapping.check_activity_lists(
             activities, validation_activities
         )
-    input_data_dict = prepare_model_data.prepare_input_data(full_year_profiles, mapping)
+    input_data_dict = prepare_model_data.prepare_input_data(
+        full_year_profiles, mapping, processes
+    )
     # calc and save input data statistics
-    statistics_set = calc_statistics_per_category(input_data_dict, activities)
+    statistics_set = calc_statistics_per_category(
+        input_data_dict, activities, processes
+    )
     return statistics_set
@@ -58,7 +58,7 @@ def save_df(
     """
     path = create_result_path(path, name, profile_type, ext)
     data.to_csv(path)
-    logging.debug(f"Created DataFrame file {path}")
+    logging.debug("Created DataFrame file %s", path)
 
 
 def load_df(path: Path, timedelta_index: bool = False) -> pd.DataFrame:
@@ -75,7 +75,7 @@ def load_df(path: Path, timedelta_index: bool = False) -> pd.DataFrame:
     if timedelta_index:
         # convert the index to timedeltas
         data.index = pd.to_timedelta(data.index)
-    logging.debug(f"Loaded DataFrame from {path}")
+    logging.debug("Loaded DataFrame from %s", path)
     return data
 
 
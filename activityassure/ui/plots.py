@@ -1,4 +1,6 @@
+import copy
 from datetime import datetime, timedelta
+import functools
 import math
 from pathlib import Path
 from dash import html, dcc  # type: ignore
@@ -6,6 +8,7 @@ import dash_bootstrap_components as dbc  # type: ignore
 import plotly.express as px  # type: ignore
 import plotly.graph_objects as go  # type: ignore
 from plotly.graph_objects import Figure  # type: ignore
+import numpy as np
 import pandas as pd
 
 from activityassure.ui.config import config
@@ -105,10 +108,11 @@ def single_plot_card(figure: Figure, title: str = "") -> dbc.Card:
     return titled_card(dcc.Graph(figure=figure, config=GLOBAL_GRAPH_CONFIG), title)
 
 
+@functools.lru_cache(maxsize=8)
 def get_date_range(num_values: int):
-    # generate 24h time range starting at 04:00
+    # generate 24h time range starting at 04:00; the index is immutable, so
+    # it can be shared by all plots with the same resolution
     resolution = timedelta(days=1) / num_values
-    start_time = datetime.strptime("04:00", "%H:%M")
     start_time = datetime(1900, 1, 1) + hetus_constants.PROFILE_OFFSET
     end_time = start_time + timedelta(days=1) - resolution
     time_values = pd.date_range(start_time, end_time, freq=resolution)
@@ -165,18 +169,49 @@ def remove_trailing_zero_rows(data: pd.DataFrame) -> pd.DataFrame:
     """
     # convert nan to 0 first
     data.fillna(0, inplace=True)
-    # find the last non-zero row
-    last_nonzero_row = (data != 0).any(axis=1).cumsum().idxmax()
-    last_nonzero_position = data.index.get_loc(last_nonzero_row)
+    # find the position of the last non-zero row
+    nonzero_positions = np.flatnonzero((data.to_numpy() != 0).any(axis=1))
+    last_nonzero_position = nonzero_positions[-1] if len(nonzero_positions) else 0
     # cut off the last zero-rows
     return data.iloc[: last_nonzero_position + 1]
 
 
+@functools.lru_cache(maxsize=64)
+def _load_df_cached(path: Path, mtime: float, timedelta_index: bool) -> pd.DataFrame:
+    """
+    Loads a statistics file. The results are cached, as the same files
+    are loaded by several plots whenever a profile type is selected. The
+    modification time is part of the cache key, so changed files are
+    loaded again.
+
+    :param path: path to the csv file
+    :param mtime: modification time of the file
+    :param timedelta_index: whether the index consists of timedeltas
+    :return: the loaded DataFrame; must not be modified
+    """
+    return pandas_utils.load_df(path, timedelta_index)
+
+
+def load_df(path: Path, timedelta_index: bool = False) -> pd.DataFrame:
+    """
+    Loads a DataFrame from a csv file, reusing previously loaded data
+    if the file did not change.
+
+    :param path: path to the csv file
+    :param timedelta_index: whether the index of the DataFrame consists of
+                            timedeltas, defaults to False
+    :return: the loaded DataFrame
+    """
+    path = path.resolve()
+    # return a copy, so the cached data is not affected by changes
+    return _load_df_cached(path, path.stat().st_mtime, timedelta_index).copy()
+
+
 def stacked_prob_curves(filepath: Path | None) -> Figure | None:
     if filepath is None or not filepath.is_file():
         return None
     # load the correct file
-    data = pandas_utils.load_df(filepath)
+    data = load_df(filepath)
     # transpose data for plotting
     data = data.T
     data = data_utils.reorder_activities(data, ACTIVITY_ORDER)
@@ -226,8 +261,8 @@ def stacked_diff_curve(path_valid: Path | None, path_in: Path | None):
     ):
         return None
     # load the correct files
-    data_val = pandas_utils.load_df(path_valid)
-    data_in = pandas_utils.load_df(path_in)
+    data_val = load_df(path_valid)
+    data_in = load_df(path_in)
 
     # get the probability profile differences
     data_val, data_in = comparison_indicators.check_data_compatibility(
@@ -271,8 +306,8 @@ def prob_curve_per_activity(
     if path_val is None or path_in is None:
         return {}
     # load both files
-    validation_data = pandas_utils.load_df(path_val)
-    input_data = pandas_utils.load_df(path_in)
+    validation_data = load_df(path_val)
+    input_data = load_df(path_in)
 
     # assign time values for the timesteps
     time_values = get_date_range(len(validation_data.columns))
@@ -342,8 +377,8 @@ def histogram_per_activity(
         return {}
 
     # load both files
-    validation_data = pandas_utils.load_df(path_val, duration_data)
-    input_data = pandas_utils.load_df(path_in, duration_data)
+    validation_data = load_df(path_val, duration_data)
+    input_data = load_df(path_in, duration_data)
     if duration_data:
         # workaround for getting a timedelta axis
         # https://github.com/plotly/plotly.py/issues/799
@@ -392,10 +427,11 @@ def stacked_bar_activity_share(paths: dict[str, Path]) -> Figure:
     :param paths: file paths for each profile type
     :return: bar chart figure
     """
-    # load all activity probability files
-    datasets = {k: pandas_utils.load_df(path) for k, path in paths.items()}
-    # calculate the average probabilities per profile type
-    data = pd.DataFrame({title: data.mean(axis=1) for title, data in datasets.items()})
+    # calculate the average probabilities per profile type; reduce each file
+    # right after loading it instead of keeping all full profiles in memory
+    data = pd.DataFrame(
+        {title: load_df(path).mean(axis=1) for title, path in paths.items()}
+    )
     # add the overall probabilities
     data["Overall"] = data.mean(axis=1)
     return px.bar(data.T)  # , x=data.columns, y=data.index)
@@ -455,10 +491,27 @@ def indicator_as_time_str(value: float) -> str:
     return timedelta_to_str(td)
 
 
-def get_all_indicator_variants(
+def get_statistics_mtimes(
+    base_path: Path, profile_type: profile_category.ProfileCategory
+) -> tuple[float | None, ...]:
+    """
+    Gets the modification times of all statistics files of a profile type.
+
+    :param base_path: the base path of the statistics
+    :param profile_type: the profile type
+    :return: the modification time of each file, or None for missing files
+    """
+    paths = validation_statistics.ValidationStatistics.get_file_paths(
+        base_path, profile_type
+    )
+    return tuple(p.stat().st_mtime if p.is_file() else None for p in paths)
+
+
+@functools.lru_cache(maxsize=32)
+def _calc_indicator_variants_cached(
     ptype_val: profile_category.ProfileCategory,
     ptype_in: profile_category.ProfileCategory,
-    add_means: bool,
+    mtimes: tuple,
 ) -> tuple[
     comparison_indicators.ValidationIndicators,
     comparison_indicators.ValidationIndicators,
@@ -466,13 +519,17 @@ def get_all_indicator_variants(
 ]:
     """
     Loads the statistics for validation and input data and calculates
-    validation indicators in all variants.
+    validation indicators in all variants, without indicator means.
+    The results are cached, because the overall and the per-activity
+    views both need the indicators for the same selection. The
+    modification times of the statistics files are part of the cache
+    key, so changed files are loaded again.
 
     :param ptype_val: the selected profile type of the validation data
     :param ptype_in: the selected profile type of the input data
-    :param add_means: if True, adds indicator means across all activities
+    :param mtimes: modification times of all statistics files that are used
     :raises RuntimeError: when statistics for a profile type could not be loaded
-    :return: tuple of validation indicators
+    :return: tuple of validation indicators; must not be modified
     """
     # load the statistics for validation and input data
     data_val = validation_statistics.ValidationStatistics.load(
@@ -483,11 +540,63 @@ def get_all_indicator_variants(
     )
     # calculate the indicators without saving them to file
     _, metrics, scaled, normed = comparison_indicators.calc_all_indicator_variants(
-        data_val, data_in, False, add_means=add_means
+        data_val, data_in, False, add_means=False
     )
     return metrics, scaled, normed
 
 
+def calc_indicator_variants(
+    ptype_val: profile_category.ProfileCategory,
+    ptype_in: profile_category.ProfileCategory,
+) -> tuple[
+    comparison_indicators.ValidationIndicators,
+    comparison_indicators.ValidationIndicators,
+    comparison_indicators.ValidationIndicators,
+]:
+    """
+    Calculates validation indicators in all variants, without indicator
+    means, reusing previous results if the statistics files did not change.
+
+    :param ptype_val: the selected profile type of the validation data
+    :param ptype_in: the selected profile type of the input data
+    :raises RuntimeError: when statistics for a profile type could not be loaded
+    :return: tuple of validation indicators
+    """
+    mtimes = (
+        get_statistics_mtimes(datapaths.validation_path, ptype_val),
+        get_statistics_mtimes(datapaths.input_data_path, ptype_in),
+    )
+    indicator_variants = _calc_indicator_variants_cached(ptype_val, ptype_in, mtimes)
+    # return a copy, so the cached indicators are not affected by changes
+    return copy.deepcopy(indicator_variants)
+
+
+def get_all_indicator_variants(
+    ptype_val: profile_category.ProfileCategory,
+    ptype_in: profile_category.ProfileCategory,
+    add_means: bool,
+) -> tuple[
+    comparison_indicators.ValidationIndicators,
+    comparison_indicators.ValidationIndicators,
+    comparison_indicators.ValidationIndicators,
+]:
+    """
+    Loads the statistics for validation and input data and calculates
+    validation indicators in all variants.
+
+    :param ptype_val: the selected profile type of the validation data
+    :param ptype_in: the selected profile type of the input data
+    :param add_means: if True, adds indicator means across all activities
+    :raises RuntimeError: when statistics for a profile type could not be loaded
+    :return: tuple of validation indicators
+    """
+    indicator_variants = calc_indicator_variants(ptype_val, ptype_in)
+    if add_means:
+        for indicators in indicator_variants:
+            indicators.add_metric_means()
+    return indicator_variants
+
+
 def indicator_table_rows(
     indicators: comparison_indicators.ValidationIndicators,
     activity: str,
@@ -3,6 +3,7 @@ Contains functions for comparing validation and model statistics.
 """
 
 import dataclasses
+import functools
 import itertools
 import logging
 from pathlib import Path
@@ -55,12 +56,14 @@ def get_similar_categories(profile_type: ProfileCategory) -> list[ProfileCategor
     return similar
 
 
-def all_profile_types_of_same_country(country) -> list[ProfileCategory]:
+@functools.lru_cache(maxsize=None)
+def all_profile_types_of_same_country(country) -> tuple[ProfileCategory, ...]:
     """
-    Returns a list of all possible profile types for a
-    fixed country.
+    Returns all possible profile types for a fixed country.
+    The result is cached, as it is needed for every input profile
+    type of the same country.
 
-    :return: a list of profile types
+    :return: a tuple of profile types
     """
     # make sure the original profile type comes first
     sexes = [e for e in categorization_attributes.Sex]
@@ -81,8 +84,8 @@ def all_profile_types_of_same_country(country) -> list[ProfileCategory]:
     )
     # change the attribute order so it matches the from_iterable function
     combinations = [(c, s, w, d) for c, d, w, s in combinations]
-    profile_types = [ProfileCategory.from_iterable(c) for c in combinations]
-    return profile_types
+    # return a tuple, as the cached result is shared by all callers
+    return tuple(ProfileCategory.from_iterable(c) for c in combinations)
 
 
 def indicator_dict_to_df(
@@ -122,8 +125,8 @@ def validate_per_category(
         # select matching validation data
         validation_data = validation_statistics.get_matching_statistics(profile_type)
         if validation_data is None:
-            logging.warn(
-                f"No matching validation data found for category {profile_type}"
+            logging.warning(
+                "No matching validation data found for category %s", profile_type
             )
             continue
         # calcluate and store comparison metrics
@@ -191,9 +194,12 @@ def validate_all_combinations(
                 )
                 dict_per_type[validation_type] = metrics
             except utils.ActValidatorException as e:
-                logging.warn(
-                    f"Could not compare input data category '{profile_type}' "
-                    f"to validation data category '{validation_type}': {e}"
+                logging.warning(
+                    "Could not compare input data category '%s' "
+                    "to validation data category '%s': %s",
+                    profile_type,
+                    validation_type,
+                    e,
                 )
         metrics_dict[profile_type] = dict_per_type
     return metrics_dict
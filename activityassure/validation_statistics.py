@@ -98,6 +98,32 @@ class ValidationStatistics:
             self.probability_profiles.T, mapping
         ).T
 
+    @staticmethod
+    def get_file_paths(
+        base_path: Path, profile_type: ProfileCategory
+    ) -> tuple[Path, Path, Path]:
+        """
+        Returns the paths of the files storing the statistics for the
+        specified profile type.
+
+        :param base_path: the base path where the files are stored
+        :param profile_type: the profile type
+        :return: the paths of the frequency, duration and probability
+                 profile files
+        """
+        freq_path = create_result_path(
+            base_path / ValidationStatistics.FREQUENCY_DIR, "freq", profile_type
+        )
+        dur_path = create_result_path(
+            base_path / ValidationStatistics.DURATION_DIR, "dur", profile_type
+        )
+        prob_path = create_result_path(
+            base_path / ValidationStatistics.PROBABILITY_PROFILE_DIR,
+            "prob",
+            profile_type,
+        )
+        return freq_path, dur_path, prob_path
+
     @staticmethod
     def load(
         base_path: Path, profile_type: ProfileCategory, size: int | None = None
@@ -114,16 +140,8 @@ class ValidationStatistics:
         :return: the object containing all data for the specified
                  profile type
         """
-        freq_path = create_result_path(
-            base_path / ValidationStatistics.FREQUENCY_DIR, "freq", profile_type
-        )
-        dur_path = create_result_path(
-            base_path / ValidationStatistics.DURATION_DIR, "dur", profile_type
-        )
-        prob_path = create_result_path(
-            base_path / ValidationStatistics.PROBABILITY_PROFILE_DIR,
-            "prob",
-            profile_type,
+        freq_path, dur_path, prob_path = ValidationStatistics.get_file_paths(
+            base_path, profile_type
         )
         if not (freq_path.is_file() and dur_path.is_file() and prob_path.is_file()):
             raise RuntimeError(
@@ -157,6 +175,8 @@ class ValidationSet:
     CATEGORY_WEIGHTS_FILE: ClassVar = "category_weights.csv"
     ACTIVITIES_DIR: ClassVar = "activities"
     ACTIVITIES_FILE: ClassVar = "activities.json"
+    #: written last when saving, marks a completely saved data set
+    COMPLETE_MARKER_FILE: ClassVar = "save_complete"
     AVAILABLE_ACTIVITIES_KEY: ClassVar = "available activities"
 
     def get_matching_statistics(
@@ -194,7 +214,9 @@ class ValidationSet:
         # delete the categories afterwards
         for category in to_delete:
             del self.statistics[category]
-        logging.info(f"Removed {len(to_delete)} out of {total} categories (too small).")
+        logging.info(
+            "Removed %d out of %d categories (too small).", len(to_delete), total
+        )
 
     def hide_small_category_sizes(self, size_ranges: list[int]):
         """
@@ -219,7 +241,7 @@ class ValidationSet:
             if new_size != old_size:
                 hidden += 1
             stat.category_size = new_size
-        logging.info(f"Obfuscated category size of {hidden} categories.")
+        logging.info("Obfuscated category size of %d categories.", hidden)
 
     def map_statistics_activities(self, mapping: dict[str, str]):
         """
@@ -256,23 +278,17 @@ class ValidationSet:
         assert len(data.columns) == 1, "DataFrame must have one column only"
         colname = data.columns[0]
         if data.index.nlevels == 1 or attribute_for_pivot not in data.index.names:
-            logging.warn(
-                f"The DataFrame only has one index level or the attribute '{attribute_for_pivot}'"
-                "is not part of the categorization. Returning the unpivoted dataframe instead."
+            logging.warning(
+                "The DataFrame only has one index level or the attribute '%s' "
+                "is not part of the categorization. Returning the unpivoted dataframe instead.",
+                attribute_for_pivot,
             )
             return data
         # this however leads to one index title missing in the csv file, which can then
         # not be loaded anymore
-        data_reset = data.reset_index()
-        cols = list(data_reset.columns)
-        assert (
-            attribute_for_pivot in cols
-        ), f"Invalid attribute for pivot: {attribute_for_pivot}"
-        cols.remove(attribute_for_pivot)
-        cols.remove(colname)
-        transformed = data_reset.pivot(
-            index=cols, columns=attribute_for_pivot, values=colname
-        )
+        # unstack the index level directly instead of resetting the index and building
+        # a hash-based pivot on the resulting columns
+        transformed = data[colname].unstack(attribute_for_pivot)
         return transformed
 
     def get_category_info_dataframe(
@@ -307,6 +323,9 @@ class ValidationSet:
 
         :param base_path: base output path
         """
+        # remove the marker of a previous save until all files are written again
+        marker = base_path / ValidationSet.COMPLETE_MARKER_FILE
+        marker.unlink(missing_ok=True)
         for stat in self.statistics.values():
             stat.save(base_path)
 
@@ -352,6 +371,8 @@ class ValidationSet:
             base_path / ValidationSet.CATEGORIES_DIR,
             "category_sizes_day_type",
         )
+        # mark the data set as complete only after all files were written
+        marker.touch()
 
     @staticmethod
     def load_category_info_dataframe(path: Path) -> dict[ProfileCategory, int]:
@@ -448,7 +469,7 @@ class ValidationSet:
             )
             for profile_type in prob_data.keys()
         }
-        logging.info(f"Loaded statistics for {len(statistics)} profile categories")
+        logging.info("Loaded statistics for %d profile categories", len(statistics))
 
         # load activity list
         activities = ValidationSet.load_activities(base_path)
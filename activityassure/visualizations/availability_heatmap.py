@@ -6,6 +6,7 @@ different profile categories.
 import os
 import pandas as pd
 import seaborn as sns  # type: ignore
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.colors import LogNorm
 import numpy as np
@@ -13,12 +14,13 @@ import numpy as np
 from activityassure.hetus_data_processing import hetus_constants
 
 
-def plot_heatmap_diary(data: pd.DataFrame, tick_labels, name):
+def plot_heatmap_diary(data: pd.DataFrame, tick_labels, name: str, directory: str):
     # create the heatmap
     fig, ax = plt.subplots(figsize=(7, 5))
     fig.subplots_adjust(left=0.35)
     heatmap: plt.Axes = sns.heatmap(
         data,
+        ax=ax,
         linewidths=0.5,
         square=True,
         cmap="flare",
@@ -29,15 +31,14 @@ def plot_heatmap_diary(data: pd.DataFrame, tick_labels, name):
     # plt.xticks(rotation=0)
 
     heatmap.set_yticks(np.arange(0.5, len(data.index)), tick_labels)
-    plt.tick_params(axis="y", which="both", length=0)
-    plt.tick_params(axis="x", which="both", length=0)
+    ax.tick_params(axis="both", which="both", length=0)
 
     heatmap.set_ylabel("")
     heatmap.set_xlabel("Country")
     # heatmap.set_title("Number of Diary Entries")
 
-    plt.savefig(os.path.join(dir, f"{name}.svg"), transparent=True)
-    plt.show()
+    fig.savefig(os.path.join(directory, f"{name}.svg"), transparent=True)
+    plt.close(fig)
 
 
 def plot_heatmaps_diary_filtered_and_unfiltered(name: str, dir: str):
@@ -66,7 +67,7 @@ def plot_heatmaps_diary_filtered_and_unfiltered(name: str, dir: str):
     # tick_labels = [f"{a:>11} {b:>8} {c:>6}" for a,b,c in data.index] # does not work due to proportional font
 
     # plot the unfiltered data
-    plot_heatmap_diary(data, tick_labels_str, name)
+    plot_heatmap_diary(data, tick_labels_str, name, dir)
 
     total = len(data) * len(data.columns)
     zeros = (data == 0).sum().sum()
@@ -85,7 +86,7 @@ def plot_heatmaps_diary_filtered_and_unfiltered(name: str, dir: str):
     )
 
     # plot the filtered heatmap as well
-    plot_heatmap_diary(data, tick_labels_str, f"{name}_filtered")
+    plot_heatmap_diary(data, tick_labels_str, f"{name}_filtered", dir)
 
 
 def plot_heatmap_person(name: str, dir: str):
@@ -103,6 +104,7 @@ def plot_heatmap_person(name: str, dir: str):
     fig.subplots_adjust(left=0.3)
     heatmap: plt.Axes = sns.heatmap(
         data,
+        ax=ax,
         linewidths=0.5,
         square=True,
         cmap="RdYlGn",
@@ -129,18 +131,19 @@ def plot_heatmap_person(name: str, dir: str):
     ]
 
     heatmap.set_yticks(np.arange(0.5, len(data.index)), tick_labels_strs)
-    plt.tick_params(axis="y", which="both", length=0)
-    plt.tick_params(axis="x", which="both", length=0)
+    ax.tick_params(axis="both", which="both", length=0)
 
     heatmap.set_ylabel("")
     heatmap.set_xlabel("Country")
     # heatmap.set_title("Number of Diary Entries")
 
-    plt.savefig(os.path.join(dir, f"{name}.svg"), transparent=True)
-    plt.show()
+    fig.savefig(os.path.join(dir, f"{name}.svg"), transparent=True)
+    plt.close(fig)
 
 
 if __name__ == "__main__":
+    # only files are created, so no interactive backend is needed
+    matplotlib.use("Agg")
     dir = ".\\data\\validation_data_sets\\full\\categories"
     name = "category_sizes_readable"
     plot_heatmaps_diary_filtered_and_unfiltered(name, dir)
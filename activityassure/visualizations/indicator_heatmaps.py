@@ -48,7 +48,9 @@ def normalize_min_max(data: pd.DataFrame) -> pd.DataFrame:
     # ignore performance warning (dataframe is small)
     with warnings.catch_warnings():
         warnings.simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
-        return (data - data.min()) / (data.max() - data.min())
+        # determine the minimum only once, it is needed twice
+        minimum = data.min()
+        return (data - minimum) / (data.max() - minimum)
 
 
 def reverse_pearson(data: pd.DataFrame) -> pd.DataFrame:
@@ -143,9 +145,11 @@ def plot_indicator_heatmap(data: pd.DataFrame, output_path: Path):
                  index and column names are the profile types
     :param output_path: base output directory
     """
-    # turn index to str
-    data.index = pd.Index([str(x).replace("_", " ") for x in data.index])
-    data.columns = pd.Index([str(x).replace("_", " ") for x in data.columns])
+    # turn index to str; index and columns mostly contain the same profile
+    # types, so convert each distinct key only once
+    labels = {x: str(x).replace("_", " ") for x in {*data.index, *data.columns}}
+    data.index = pd.Index([labels[x] for x in data.index])
+    data.columns = pd.Index([labels[x] for x in data.columns])
     fig = px.imshow(
         data,
         # title=data.Name,
@@ -185,7 +189,7 @@ def plot_indicator_heatmap(data: pd.DataFrame, output_path: Path):
     try:
         fig.write_image(file, engine="kaleido")
     except Exception as e:
-        logging.error(f"Could not create KPI heatmap {data.Name}: {e}")
+        logging.error("Could not create KPI heatmap %s: %s", data.Name, e)
 
 
 def make_symmetric(data: pd.DataFrame, sparse: bool = True) -> pd.DataFrame:
@@ -206,14 +210,9 @@ def make_symmetric(data: pd.DataFrame, sparse: bool = True) -> pd.DataFrame:
     # the other way round).
 
     if sparse:
-        # make the dataframe square, with colum and row index being exactly the same
-        d = pd.DataFrame(columns=data.index)
-        for col in d.columns:
-            if col in data.columns:
-                d[col] = data[col]
-            else:
-                d[col] = pd.NA
-        return d
+        # make the dataframe square, with colum and row index being exactly the same;
+        # reindex in one step instead of adding the columns one by one
+        return data.reindex(columns=data.index)
 
     # put the profile types that occur in both indices first, and the rest after
     index = list(data.columns) + [x for x in data.index if x not in data.columns]
@@ -2,13 +2,23 @@
 Plots stacked daily probability curves.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+import functools
 import os
 import pandas as pd
 import seaborn as sns  # type: ignore
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.dates
 
+# seaborn theme settings, built once and only applied while plotting
+_THEME_RC = {
+    **sns.axes_style("darkgrid"),
+    **sns.plotting_context("notebook"),
+    "axes.prop_cycle": matplotlib.cycler(color=sns.color_palette("deep")),
+}
+
 
 def plot_stacked_probability_curves(name: str, directory: str) -> None:
     csv_path = os.path.join(directory, name + ".csv")
@@ -27,40 +37,64 @@ def plot_stacked_probability_curves(name: str, directory: str) -> None:
     time_values = pd.date_range(start_time, end_time, freq=resolution)
     # time_values = [(x/6) % 24 for x in range(0, 145)]
 
-    sns.set_theme()
-
-    fig, ax = plt.subplots(figsize=(5, 6))
-    fig.subplots_adjust(left=0.2, top=0.95, bottom=0.5, right=0.95)
-
-    plt.stackplot(time_values, data.values, labels=data.index)
-
-    # change x-tick labels
-    hours_fmt = matplotlib.dates.DateFormatter("%#H")
-    hours = matplotlib.dates.HourLocator(byhour=range(1, 24, 3))
-    ax.xaxis.set_major_locator(hours)
-    ax.xaxis.set_major_formatter(hours_fmt)
-
-    # Shrink current axis by 20%
-    # box = ax.get_position()
-    # ax.set_position([box.x0 * 0.3, box.y0 * 1.5, box.width, box.height * 0.5])
-
-    # place legend below figure
-    ax.legend(loc="upper center", bbox_to_anchor=(0.5, -0.2))
-
-    plt.xlabel("Time [h]")
-    plt.ylabel("Probability")
-
     plot_dir = os.path.join(directory, "plots")
     os.makedirs(plot_dir, exist_ok=True)
     plot_filename = os.path.join(plot_dir, f"{name}.svg")
-    plt.savefig(plot_filename, transparent=True)
-    plt.show()
+
+    with plt.rc_context(_THEME_RC):
+        fig, ax = plt.subplots(figsize=(5, 6))
+        fig.subplots_adjust(left=0.2, top=0.95, bottom=0.5, right=0.95)
+
+        ax.stackplot(time_values, data.values, labels=data.index)
+
+        # change x-tick labels
+        hours_fmt = matplotlib.dates.DateFormatter("%#H")
+        hours = matplotlib.dates.HourLocator(byhour=range(1, 24, 3))
+        ax.xaxis.set_major_locator(hours)
+        ax.xaxis.set_major_formatter(hours_fmt)
+
+        # Shrink current axis by 20%
+        # box = ax.get_position()
+        # ax.set_position([box.x0 * 0.3, box.y0 * 1.5, box.width, box.height * 0.5])
+
+        # place legend below figure
+        ax.legend(loc="upper center", bbox_to_anchor=(0.5, -0.2))
+
+        ax.set_xlabel("Time [h]")
+        ax.set_ylabel("Probability")
+
+        fig.savefig(plot_filename, transparent=True)
+    plt.close(fig)
+
+
+def plot_all_stacked_probability_curves(
+    directory: str, processes: int | None = None
+) -> None:
+    """
+    Plots the stacked probability curves for all files in the directory.
+    The plots are independent of each other, so they are rendered in
+    separate processes.
+
+    :param directory: directory containing the probability profile files
+    :param processes: number of worker processes, defaults to None (one per CPU)
+    """
+    names = [
+        os.path.splitext(name)[0]
+        for name in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, name))
+    ]
+    plot = functools.partial(plot_stacked_probability_curves, directory=directory)
+    # only files are created, so no interactive backend is needed
+    with ProcessPoolExecutor(
+        processes, initializer=matplotlib.use, initargs=("Agg",)
+    ) as executor:
+        # consume the iterator to raise any exceptions from the workers
+        list(executor.map(plot, names))
 
 
 if __name__ == "__main__":
+    # only files are created, so no interactive backend is needed
+    matplotlib.use("Agg")
     dir = ".\\data\\validation_data\\probability_profiles"
-    for name in os.listdir(dir):
-        if os.path.isfile(os.path.join(dir, name)):
-            # name = "probabilities ('DE', 1, 0.0, 0)"
-            name = os.path.splitext(name)[0]
-            plot_stacked_probability_curves(name, dir)
+    # name = "probabilities ('DE', 1, 0.0, 0)"
+    plot_all_stacked_probability_curves(dir)
@@ -3,6 +3,7 @@ Example that demonstrates usage of ETHOS.ActivityAssure by validating
 the LoadProfileGenerator.
 """
 
+import argparse
 from datetime import timedelta
 import logging
 from pathlib import Path
@@ -14,48 +15,91 @@ from activityassure.validation_statistics import ValidationSet
 
 
 def merge_activities(
-    statistics_path: Path, merging_path: Path, new_path: Path | None = None
-):
+    statistics: ValidationSet | Path, merging_path: Path, new_path: Path | None = None
+) -> ValidationSet:
     """
-    Loads validation statistics and merges activities according to the specified file.
-    The translated statistics are then saved with a new name
+    Merges activities in validation statistics according to the specified file.
+    The statistics can be passed directly, in which case they are adapted in place,
+    or loaded from a path. The translated statistics are then saved with a new name
 
-    :param statistics_path: path of validation statistics to adapt
+    :param statistics: validation statistics to adapt, or their path
     :param merging_path: path of the merging file to use
-    :param new_name: new name for the adapted statistics, by default appends "_mapped"
+    :param new_path: new path for the adapted statistics; by default, "_mapped" is
+                     appended to the path of loaded statistics, while passed
+                     statistics are not saved
+    :return: the adapted statistics
     """
-    # load statistics and merging map and apply the merging
-    validation_statistics = ValidationSet.load(statistics_path)
+    # load statistics if necessary
+    if isinstance(statistics, Path):
+        # determine the new file name for the mapped statistics
+        new_path = new_path or statistics.with_name(f"{statistics.name}_mapped")
+        statistics = ValidationSet.load(statistics)
+    # load the merging map and apply the merging
     mapping, _ = activity_mapping.load_mapping_and_activities(merging_path)
-    validation_statistics.map_statistics_activities(mapping)
-    # determine the new file name for the mapped statistics
-    new_path = new_path or Path(f"{statistics_path}_mapped")
-    # save the mapped statistics
-    validation_statistics.save(new_path)
+    statistics.map_statistics_activities(mapping)
+    if new_path is not None:
+        # save the mapped statistics
+        statistics.save(new_path)
+    return statistics
+
+
+def is_up_to_date(statistics_path: Path, inputs: list[Path]) -> bool:
+    """
+    Checks if saved statistics exist and are newer than all files they
+    were created from, so that they don't need to be calculated again.
+
+    :param statistics_path: path of the saved statistics
+    :param inputs: input files and directories the statistics depend on
+    :return: True if the saved statistics are up to date, else False
+    """
+    # the marker file is written at the very end of ValidationSet.save, so
+    # it only exists if the statistics were saved completely
+    marker = statistics_path / ValidationSet.COMPLETE_MARKER_FILE
+    if not marker.is_file():
+        return False
+    try:
+        input_files = [
+            f for p in inputs for f in ([p] if p.is_file() else p.rglob("*"))
+        ]
+        newest_input = max(f.stat().st_mtime for f in inputs + input_files)
+    except FileNotFoundError:
+        # an input is missing, so the statistics cannot be checked
+        return False
+    return marker.stat().st_mtime > newest_input
 
 
 @utils.timing
 def validate(
-    input_path: Path, validation_path: Path, compare_all_combinations: bool = False
+    input_statistics: ValidationSet | Path,
+    validation_statistics: ValidationSet | Path,
+    output_path: Path,
+    compare_all_combinations: bool = False,
 ):
     """
-    Load input and validation statistics and compare them
-    using indicators and heatmaps.
-
+    Compare input and validation statistics using indicators and heatmaps.
+    The statistics can either be passed directly, or as paths to load them
+    from. Passing statistics that are already in memory avoids loading them
+    again right after they were saved.
+
+    :param input_statistics: input statistics or their path
+    :param validation_statistics: validation statistics or their path
+    :param output_path: base path for the validation results
     :param compare_all_combinations: if True, in attition to the normal
                                      per-category validation, all combinations
                                      of profile categories will be checked;
                                      defaults to False
     """
-    # load LPG statistics and validation statistics
-    input_statistics = ValidationSet.load(input_path)
-    validation_statistics = ValidationSet.load(validation_path)
+    # load LPG statistics and validation statistics if necessary
+    if isinstance(input_statistics, Path):
+        input_statistics = ValidationSet.load(input_statistics)
+    if isinstance(validation_statistics, Path):
+        validation_statistics = ValidationSet.load(validation_statistics)
 
     # compare input and validation data statistics per profile category
     indicator_dict_variants = validation.validate_per_category(
-        input_statistics, validation_statistics, input_path
+        input_statistics, validation_statistics, output_path
     )
-    validation_result_path = input_path / "validation_results"
+    validation_result_path = output_path / "validation_results"
 
     # save indicators and heatmaps for each indicator variant
     for variant_name, metric_dict in indicator_dict_variants.items():
@@ -79,7 +123,7 @@ def validate(
             input_statistics, validation_statistics
         )
         validation.save_file_per_indicator_per_combination(
-            indicators_all_combinations, input_path
+            indicators_all_combinations, output_path
         )
 
         # plot heatmaps to compare the different categories to each other
@@ -92,9 +136,17 @@ def validate(
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Show debug log messages, including timing information",
+    )
+    args = parser.parse_args()
     logging.basicConfig(
         format="%(asctime)s %(levelname)-8s %(message)s",
-        level=logging.DEBUG,
+        level=logging.DEBUG if args.verbose else logging.INFO,
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
@@ -110,25 +162,42 @@ if __name__ == "__main__":
     validation_stats_path = Path(
         "data/validation_data_sets/activity_validation_data_set"
     )
-    validation_stats_path_merged = Path(f"{validation_stats_path}_merged")
+    validation_stats_path_merged = validation_stats_path.with_name(
+        f"{validation_stats_path.name}_merged"
+    )
     # input statistics path
     # here the statistics of the input data and the validation results will be stored
     input_stats_path = Path("data/validation/lpg_example")
 
     # the LoadProfileGenerator simulates cooking and eating as one activity, therefore these
     # two activities must be merged in the validation statistics
-    merge_activities(validation_stats_path, merging_file, validation_stats_path_merged)
+    # results from previous runs are reused if none of their inputs changed; this
+    # script is an input as well, as it defines the parameters used for processing
+    script_file = Path(__file__)
+    if is_up_to_date(
+        validation_stats_path_merged,
+        [validation_stats_path, merging_file, script_file],
+    ):
+        validation_statistics = ValidationSet.load(validation_stats_path_merged)
+    else:
+        validation_statistics = merge_activities(
+            validation_stats_path, merging_file, validation_stats_path_merged
+        )
 
     # calculate statistics for the input model data
-    input_statistics = process_model_data.process_model_data(
-        input_data_path,
-        mapping_file,
-        person_trait_file,
-        profile_resolution,
-        categories_per_person=False,
-    )
-    # save the created statistics
-    input_statistics.save(input_stats_path)
+    model_inputs = [input_data_path, mapping_file, person_trait_file, script_file]
+    if is_up_to_date(input_stats_path, model_inputs):
+        input_statistics = ValidationSet.load(input_stats_path)
+    else:
+        input_statistics = process_model_data.process_model_data(
+            input_data_path,
+            mapping_file,
+            person_trait_file,
+            profile_resolution,
+            categories_per_person=False,
+        )
+        # save the created statistics
+        input_statistics.save(input_stats_path)
 
-    # validate the input data using the statistics
-    validate(input_stats_path, validation_stats_path_merged)
+    # validate the input data using the statistics that are already in memory
+    validate(input_statistics, validation_statistics, input_stats_path)
@@ -9,10 +9,14 @@ If a mapping file already exists, it is loaded and expanded if necessary.
 """
 
 import argparse
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import json
+import os
 from pathlib import Path
 import sqlite3
+from typing import Iterator
 
 import pandas as pd
 import tqdm
@@ -22,6 +26,9 @@ from activityassure import activity_mapping
 import create_lpg_person_characteristics as create_lpg_char
 
 
+#: path of the LPG activity mapping file that is created or extended
+MAPPING_PATH = Path("examples/LoadProfileGenerator/activity_mapping_lpg.json")
+
 # preliminary affordance mappings according to affordance categories
 UNMAPPED_CATEGORY = "TODO"
 CATEGORY_MAPPING = {
@@ -45,25 +52,38 @@ CATEGORY_MAPPING = {
 }
 
 
-def load_activity_profile_from_db(raw_data_dir: Path, result_dir: Path):
+def open_result_database(db_file: Path) -> sqlite3.Connection:
+    """
+    Opens an LPG result database in read-only mode and configures the
+    connection for reading large tables sequentially.
+
+    :param db_file: path of the result database
+    :return: the database connection
+    """
+    con = sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True)
+    con.execute("PRAGMA query_only=1")
+    # map the database file into memory and use a larger page cache (64 MB)
+    con.execute("PRAGMA mmap_size=268435456")
+    con.execute("PRAGMA cache_size=-65536")
+    con.execute("PRAGMA temp_store=MEMORY")
+    return con
+
+
+def load_activity_profile_from_db(
+    raw_data_dir: Path, result_dir: Path, mapping: dict[str, str]
+) -> dict[str, str]:
     """
     Converts LPG activity profiles to the target csv format.
-    Also creates or extends the LPG activity mapping file.
+    Also determines all affordances that are not yet contained in the
+    LPG activity mapping, along with a preliminary mapping for each.
 
     :param raw_data_dir: input raw data directory from one LPG calculation
     :param result_dir: output folder for the created csv files
+    :param mapping: the existing LPG activity mapping
+    :return: preliminary mapping for all affordances that were not mapped yet
     """
     assert raw_data_dir.is_dir(), f"Raw data directory does not exist: {raw_data_dir}"
 
-    # load activity mapping
-    mapping_path = Path("examples/LoadProfileGenerator/activity_mapping_lpg.json")
-    if mapping_path.is_file():
-        # load the existent mapping to extend it
-        mapping = activity_mapping.load_mapping(mapping_path)
-    else:
-        # initialize a new mapping
-        mapping = {}
-
     main_db_file = raw_data_dir / "Results.HH1.sqlite"
     assert main_db_file.is_file(), f"Result file does not exist: {main_db_file}"
 
@@ -73,8 +93,7 @@ def load_activity_profile_from_db(raw_data_dir: Path, result_dir: Path):
     template = raw_data_dir.parent.name
 
     # get all activities from LPG result database
-    con = sqlite3.connect(str(main_db_file))
-    with con:
+    with closing(open_result_database(main_db_file)) as con:
         cur = con.cursor()
         query = "SELECT * FROM PerformedActions"
         results = cur.execute(query)
@@ -97,13 +116,6 @@ def load_activity_profile_from_db(raw_data_dir: Path, result_dir: Path):
         activity_entry = (start_step, start_date, affordance)
         rows_by_person.setdefault(person, []).append(activity_entry)
 
-    if unmapped_affordances:
-        print(f"Found {len(unmapped_affordances)} unmapped affordances")
-        merged = mapping | unmapped_affordances
-        with open(mapping_path, "w") as f:
-            # add unmapped affordances to mapping file
-            json.dump(merged, f, indent=4)
-
     # store the activities in a DataFrame
     base_result_dir = Path(result_dir)
     base_result_dir.mkdir(parents=True, exist_ok=True)
@@ -114,6 +126,95 @@ def load_activity_profile_from_db(raw_data_dir: Path, result_dir: Path):
         person_id = create_lpg_char.get_person_id(person_name, template)
         result_path = base_result_dir / f"{person_id}_{iteration}.csv"
         data.to_csv(result_path)
+    return unmapped_affordances
+
+
+def iter_iteration_dirs(input_dir: Path, errors_dir: str) -> Iterator[Path]:
+    """
+    Iterates through the raw data directories of all LPG calculations. Uses
+    os.scandir, which provides the file type of each entry without an
+    additional stat call.
+
+    :param input_dir: root directory of the raw input data
+    :param errors_dir: name of the errors subdirectory, which is skipped
+    :yield: raw data directory of each LPG calculation
+    """
+    # expected directory structure: one directory per LPG template
+    with os.scandir(input_dir) as template_dirs:
+        for template_dir in template_dirs:
+            assert template_dir.is_dir(), f"Unexpected file found: {template_dir.path}"
+            if template_dir.name == errors_dir:
+                # skip the errors directory
+                continue
+            # each template directory contains one subdirectory per iteration
+            with os.scandir(template_dir.path) as entries:
+                for entry in entries:
+                    assert entry.is_dir(), f"Unexpected file found: {entry.path}"
+                    yield Path(entry.path)
+
+
+def convert_activity_profiles(
+    input_dir: Path, result_dir: Path, processes: int | None = None
+):
+    """
+    Converts the LPG activity profiles of all templates and iterations in the
+    input directory. The households are converted in parallel. Also creates
+    or extends the LPG activity mapping file.
+
+    :param input_dir: root directory of the raw input data
+    :param result_dir: root directory for the preprocessed result data
+    :param processes: number of worker processes, defaults to None (one per CPU)
+    """
+    # subdirectory where error messages from failed conversions are stored
+    errors_dir = "errors"
+
+    # load the activity mapping only once for all households
+    if MAPPING_PATH.is_file():
+        # load the existent mapping to extend it
+        mapping = activity_mapping.load_mapping(MAPPING_PATH)
+    else:
+        # initialize a new mapping
+        mapping = {}
+
+    unmapped_affordances: dict[str, str] = {}
+    with ProcessPoolExecutor(processes) as executor:
+        try:
+            # submit each directory as soon as it is found, so the workers can
+            # already start while the remaining directories are collected
+            futures = {
+                executor.submit(
+                    load_activity_profile_from_db, d, result_dir, mapping
+                ): d
+                for d in iter_iteration_dirs(input_dir, errors_dir)
+            }
+            for future in tqdm.tqdm(as_completed(futures), total=len(futures)):
+                iteration_dir = futures[future]
+                try:
+                    unmapped = future.result()
+                except Exception as e:
+                    print(f"An error occurred while processing '{iteration_dir}': {e}")
+                    # if the LPG created a log file, move that to the errors directory
+                    logfile = iteration_dir / "Log.CommandlineCalculation.txt"
+                    if logfile.is_file():
+                        template = iteration_dir.parent.name
+                        logfile.rename(
+                            input_dir
+                            / errors_dir
+                            / f"{template}_{iteration_dir.name}_error.txt"
+                        )
+                    continue
+                # keep the first preliminary mapping found for each affordance
+                unmapped_affordances = unmapped | unmapped_affordances
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if unmapped_affordances:
+        print(f"Found {len(unmapped_affordances)} unmapped affordances")
+        merged = mapping | unmapped_affordances
+        with open(MAPPING_PATH, "w") as f:
+            # add unmapped affordances to mapping file
+            json.dump(merged, f, indent=4)
 
 
 if __name__ == "__main__":
@@ -134,32 +235,17 @@ if __name__ == "__main__":
         default="data/lpg_simulations/preprocessed",
         required=False,
     )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        help="Number of worker processes (default: one per CPU)",
+        default=None,
+        required=False,
+    )
     args = parser.parse_args()
     input_dir = Path(args.input)
     result_dir = Path(args.output)
     assert input_dir.is_dir(), f"Invalid path: {input_dir}"
 
-    # subdirectory where error messages from failed conversions are stored
-    errors_dir = "errors"
-
-    # expected directory structure: one directory per LPG template
-    for template_dir in tqdm.tqdm(Path(input_dir).iterdir()):
-        assert template_dir.is_dir(), f"Unexpected file found: {template_dir}"
-        if template_dir.name == errors_dir:
-            # skip the errors directory
-            continue
-        # each template directory contains one subdirectory per iteration
-        for iteration_dir in template_dir.iterdir():
-            assert iteration_dir.is_dir(), f"Unexpected file found: {iteration_dir}"
-            try:
-                load_activity_profile_from_db(iteration_dir, result_dir)
-            except Exception as e:
-                print(f"An error occurred while processing '{iteration_dir}': {e}")
-                # if the LPG created a log file, move that to the errors directory
-                logfile = iteration_dir / "Log.CommandlineCalculation.txt"
-                if logfile.is_file():
-                    logfile.rename(
-                        input_dir
-                        / errors_dir
-                        / f"{template_dir.name}_{iteration_dir.name}_error.txt"
-                    )
+    convert_activity_profiles(input_dir, result_dir, args.processes)
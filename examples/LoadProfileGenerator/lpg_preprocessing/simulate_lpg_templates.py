@@ -4,6 +4,7 @@ results for preprocessing.
 """
 
 from pathlib import Path
+import sys
 import time
 import utspclient
 from utspclient.datastructures import TimeSeriesRequest
@@ -39,6 +40,14 @@ templates: list[str] = [
     v for k, v in vars(HouseholdTemplates).items() if not k.startswith("__")
 ]
 repetitions_per_hh = 10
+# if False, calculations for which a result file already exists are skipped
+overwrite_existing = False
+
+# result directory for all calculations
+base_result_path = Path(
+    "/storage_cluster/projects/2022-d-neuroth-phd/results/activityassure/lpg_simulations/raw"
+)
+errors_path = base_result_path / "errors"
 
 print(f"--- Simulating the following {len(templates)} templates:")
 print("\n".join(templates))
@@ -62,24 +71,27 @@ for template in templates:
             ),
         )
         for i in range(repetitions_per_hh)
+        if overwrite_existing
+        or not (base_result_path / template_id / f"{i:02d}" / result_file).is_file()
     ]
     template_guids_and_requests.extend(new_ids_and_requests)
 
+skipped = len(templates) * repetitions_per_hh - len(template_guids_and_requests)
+if skipped:
+    print(f"Skipping {skipped} calculations that already have results")
+if not template_guids_and_requests:
+    print("All calculations already have results")
+    sys.exit()
+
 template_names, requests = zip(*template_guids_and_requests)
 start = time.time()
 results = utspclient.calculate_multiple_requests(
     REQUEST_URL, requests, API_KEY, raise_exceptions=False
 )
 d = round(time.time() - start, 2)
-print(
-    f"Calculation of {len(new_ids_and_requests) * len(templates)} requests took {d} sec."
-)
+print(f"Calculation of {len(requests)} requests took {d} sec.")
 
 # save all result files
-base_result_path = Path(
-    "/storage_cluster/projects/2022-d-neuroth-phd/results/activityassure/lpg_simulations/raw"
-)
-errors_path = base_result_path / "errors"
 errors_path.mkdir(parents=True, exist_ok=True)
 for template, request, result in zip(template_names, requests, results):
     filename = f"{template}_{request.guid}.sqlite"
@@ -16,7 +16,10 @@ if __name__ == "__main__":
 
     # load the indicators
     indicators_default = pd.read_csv(base_path.format("default"))
-    indicators_scaled = pd.read_csv(base_path.format("scaled"))
+    # only the scaled distance indicators are needed
+    indicators_scaled = pd.read_csv(
+        base_path.format("scaled"), usecols=["mae", "rmse", "bias", "wasserstein"]
+    )
     # add the scaled indicators to the default dataframe
     indicators_scaled = indicators_scaled.loc[
         :, ["mae", "rmse", "bias", "wasserstein"]
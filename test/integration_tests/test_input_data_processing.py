@@ -56,3 +56,29 @@ def test_lpg_example():
     # indicator_dict_variants = validation.validate_per_category(
     #     input_statistics, validation_statistics, input_path
     # )
+
+
+def test_lpg_example_parallel():
+    # process the LPG data with and without worker processes
+    lpg_input_dir = Path("examples/LoadProfileGenerator/data")
+    input_data_path = lpg_input_dir / "preprocessed"
+    mapping_file = lpg_input_dir / "activity_mapping.json"
+    person_trait_file = lpg_input_dir / "person_characteristics.json"
+    profile_resolution = timedelta(minutes=1)
+
+    sequential = process_model_data.process_model_data(
+        input_data_path, mapping_file, person_trait_file, profile_resolution
+    )
+    parallel = process_model_data.process_model_data(
+        input_data_path,
+        mapping_file,
+        person_trait_file,
+        profile_resolution,
+        processes=2,
+    )
+    assert sequential.statistics.keys() == parallel.statistics.keys()
+    for category, statistics in sequential.statistics.items():
+        other = parallel.statistics[category]
+        assert statistics.probability_profiles.equals(other.probability_profiles)
+        assert statistics.activity_frequencies.equals(other.activity_frequencies)
+        assert statistics.activity_durations.equals(other.activity_durations)
@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from activityassure.activity_profile import (
+    ActivityProfileEntry,
+    ExpandedActivityProfiles,
+    SparseActivityProfile,
+)
+from activityassure.profile_category import ProfileCategory
+
+
+def create_sparse_profile(activities: list[tuple[str, int, int]]):
+    """
+    Creates a sparse activity profile with a 10 minute resolution.
+
+    :param activities: name, start and duration of each activity
+    :return: the sparse activity profile
+    """
+    entries = [ActivityProfileEntry(*a) for a in activities]
+    return SparseActivityProfile(entries, timedelta(hours=4), timedelta(minutes=10))
+
+
+def test_sparse_expanded_round_trip():
+    """
+    Tests converting sparse profiles to expanded format and back.
+    """
+    activities = [
+        [("sleep", 0, 3), ("eat", 3, 1), ("work", 4, 4), ("sleep", 8, 2)],
+        [("work", 0, 10)],
+    ]
+    profiles = [create_sparse_profile(a) for a in activities]
+    expanded = ExpandedActivityProfiles.from_sparse_profiles(profiles)
+
+    assert expanded.data.shape == (2, 10), "Wrong shape of expanded profiles"
+    expected = ["sleep"] * 3 + ["eat"] + ["work"] * 4 + ["sleep"] * 2
+    assert expanded.data.iloc[0].tolist() == expected, "Wrong expanded profile"
+    assert (expanded.data.iloc[1] == "work").all(), "Wrong expanded profile"
+
+    converted = expanded.create_sparse_profiles()
+    for profile, original in zip(converted, activities, strict=True):
+        result = [(a.name, a.start, a.duration) for a in profile.activities]
+        assert result == original, "Round trip changed the profile"
+
+
+def test_from_sparse_profiles_with_wrong_durations():
+    """
+    Tests that profiles with activity durations that do not add up to the
+    profile length are rejected.
+    """
+    profiles = [
+        create_sparse_profile([("sleep", 0, 4), ("work", 4, 6)]),
+        # the activities leave a gap, but end at the same timestep
+        create_sparse_profile([("sleep", 0, 4), ("work", 5, 5)]),
+    ]
+    with pytest.raises(AssertionError, match="do not add up"):
+        ExpandedActivityProfiles.from_sparse_profiles(profiles)
+
+
+def test_create_sparse_profiles_with_missing_values():
+    """
+    Tests that consecutive missing values at the start, in the middle and
+    at the end of a profile are each combined into a single activity.
+    """
+    nan = np.nan
+    data = pd.DataFrame(
+        [
+            [nan, nan, "sleep", "sleep", nan, nan, nan, "work", nan, nan],
+            ["sleep"] * 2 + ["eat"] + ["work"] * 3 + ["eat"] * 2 + ["sleep"] * 2,
+        ]
+    )
+    expanded = ExpandedActivityProfiles(
+        data, ProfileCategory(), timedelta(hours=4), timedelta(minutes=10)
+    )
+    profiles = expanded.create_sparse_profiles()
+
+    assert len(profiles) == 2, "Wrong number of profiles"
+    # check the profile with missing values
+    activities = profiles[0].activities
+    names = [a.name for a in activities]
+    is_missing = [True, False, True, False, True]
+    assert pd.isna(names).tolist() == is_missing, "Missing values not combined"
+    assert [n for n in names if not pd.isna(n)] == ["sleep", "work"], "Wrong names"
+    assert [a.start for a in activities] == [0, 2, 4, 7, 8], "Wrong starts"
+    assert [a.duration for a in activities] == [2, 2, 3, 1, 2], "Wrong durations"
+    # check the complete profile
+    activities = profiles[1].activities
+    names = ["sleep", "eat", "work", "eat", "sleep"]
+    assert [a.name for a in activities] == names, "Wrong names"
+    assert [a.duration for a in activities] == [2, 1, 3, 2, 2], "Wrong durations"
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from activityassure.activity_profile import (
+    ActivityProfileEntry,
+    SparseActivityProfile,
+)
+from activityassure.hetus_data_processing import category_statistics
+
+
+def create_profiles(weights: list[float | None]) -> list[SparseActivityProfile]:
+    """
+    Creates three sparse activity profiles with a 10 minute resolution.
+
+    :param weights: the weight of each profile
+    :return: the list of profiles
+    """
+    activities = [
+        [("sleep", 0, 3), ("work", 3, 4), ("sleep", 7, 3)],
+        [("eat", 0, 2), ("work", 2, 4), ("sleep", 6, 4)],
+        [("sleep", 0, 5), ("work", 5, 2), ("eat", 7, 3)],
+    ]
+    return [
+        SparseActivityProfile(
+            [ActivityProfileEntry(*a) for a in profile_activities],
+            timedelta(hours=4),
+            timedelta(minutes=10),
+            weight=weight,
+        )
+        for profile_activities, weight in zip(activities, weights, strict=True)
+    ]
+
+
+def check_durations(durations: pd.DataFrame, expected: dict[str, list[float]]):
+    """
+    Compares calculated duration distributions to the expected values.
+
+    :param durations: the calculated duration distributions
+    :param expected: expected probabilities for durations of 20 to 60 minutes,
+                     for each activity
+    """
+    index = [timedelta(minutes=m) for m in range(20, 70, 10)]
+    assert list(durations.index) == index, "Wrong durations"
+    assert list(durations.columns) == list(expected), "Wrong activities"
+    for activity, probabilities in expected.items():
+        assert np.isclose(
+            durations[activity], probabilities
+        ).all(), f"Wrong distribution for {activity}"
+
+
+def test_activity_group_durations():
+    """
+    Tests the unweighted duration distribution of each activity. As first
+    and last activity of the first profile are the same, they are merged.
+    """
+    profiles = create_profiles([None, None, None])
+    durations = category_statistics.calc_activity_group_durations(profiles)
+    expected = {
+        "work": [1 / 3, 0, 2 / 3, 0, 0],
+        "sleep": [0, 0, 1 / 3, 1 / 3, 1 / 3],
+        "eat": [0.5, 0.5, 0, 0, 0],
+    }
+    check_durations(durations, expected)
+
+
+def test_activity_group_durations_weighted():
+    """
+    Tests the weighted duration distribution of each activity.
+    """
+    profiles = create_profiles([2, 1, 1])
+    durations = category_statistics.calc_activity_group_durations(profiles)
+    expected = {
+        "work": [0.25, 0, 0.75, 0, 0],
+        "sleep": [0, 0, 0.25, 0.25, 0.5],
+        "eat": [0.5, 0.5, 0, 0, 0],
+    }
+    check_durations(durations, expected)
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from activityassure import comparison_indicators
+
+
+def calc_reference_pearson_coeff(row1: np.ndarray, row2: np.ndarray) -> float:
+    """
+    Calculates the pearson coefficient of two rows separately, using only
+    the pairs of values where both are available.
+
+    :param row1: first row
+    :param row2: second row
+    :return: the pearson coefficient, or NaN if it is not defined
+    """
+    valid = ~(np.isnan(row1) | np.isnan(row2))
+    row1, row2 = row1[valid], row2[valid]
+    if len(row1) < 2 or np.ptp(row1) == 0 or np.ptp(row2) == 0:
+        return np.nan
+    return np.corrcoef(row1, row2)[0, 1]
+
+
+def test_pearson_coeff():
+    """
+    Tests the vectorized pearson coefficients against a per-row calculation,
+    including rows with NaN gaps and constant rows.
+    """
+    rows = ["regular", "gap 1", "gap 2", "gaps both", "constant", "all NaN"]
+    data1 = pd.DataFrame(
+        [
+            [0.1, 0.4, 0.3, 0.9, 0.5],
+            [np.nan, 0.4, 0.3, 0.9, 0.5],
+            [0.1, 0.4, 0.3, 0.9, 0.5],
+            [0.1, np.nan, 0.3, 0.9, 0.5],
+            [0.2, 0.2, 0.2, 0.2, 0.2],
+            [np.nan] * 5,
+        ],
+        index=rows,
+    )
+    data2 = pd.DataFrame(
+        [
+            [0.2, 0.3, 0.1, 0.7, 0.6],
+            [0.2, 0.3, 0.1, 0.7, 0.6],
+            [0.2, 0.3, np.nan, np.nan, 0.6],
+            [0.2, 0.3, 0.1, np.nan, 0.6],
+            [0.2, 0.3, 0.1, 0.7, 0.6],
+            [0.2, 0.3, 0.1, 0.7, 0.6],
+        ],
+        index=rows,
+    )
+    # use a different row order for the second data set
+    coeffs = comparison_indicators.calc_pearson_coeff(data1, data2.iloc[::-1])
+    expected = [
+        calc_reference_pearson_coeff(row1, row2)
+        for row1, row2 in zip(data1.to_numpy(), data2.to_numpy())
+    ]
+    assert list(coeffs.index) == rows, "Wrong row labels"
+    assert np.allclose(coeffs, expected, equal_nan=True), "Wrong coefficients"
+    assert coeffs[["constant", "all NaN"]].isna().all(), "Undefined values not NaN"